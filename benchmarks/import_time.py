@@ -0,0 +1,126 @@
+"""Cold-start import time for the CLI and dashboard entry points.
+
+    python -m benchmarks.import_time                   # 5 fresh interpreters per entry point
+    python -m benchmarks.import_time --top 15
+    python -m benchmarks.import_time --save-baseline   # later runs are compared against this one
+
+Each run starts a new interpreter with `-X importtime`. The CLI entry is
+`import main`. The dashboard entry runs only the top-level import statements
+of modules/dashboard.py, not the script itself, so it measures the imports
+every cold start pays before anything is drawn. Interpreter startup imports
+are left out. Heavy libraries that end up loaded are listed so a regression
+in lazy loading shows up immediately.
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES_DIR = os.path.join(_PROJECT_DIR, "modules")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+LATEST_PATH = os.path.join(RESULTS_DIR, "import_time.json")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "import_time_baseline.json")
+
+HEAVY_PACKAGES = ("pandas", "numpy", "matplotlib", "pdfplumber", "docx", "reportlab", "requests", "wordcloud", "PIL")
+
+# an entry point is slower than its baseline when its median grows by more than this fraction
+REGRESSION_THRESHOLD = 0.25
+
+def _dashboard_imports() -> str:
+    with open(os.path.join(MODULES_DIR, "dashboard.py"), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    imports = [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join([f"import sys; sys.path.insert(0, {MODULES_DIR!r})"] + imports)
+
+def entry_points() -> Dict[str, str]:
+    return {"cli": "import main", "dashboard": _dashboard_imports()}
+
+def _importtime(code: str) -> List[Tuple[int, int, int, str]]:
+    """(self_us, cumulative_us, depth, module) for every import made while running `code`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=_PROJECT_DIR,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+def measure(code: str, startup: set, runs: int = 5) -> dict:
+    totals = []
+    by_package = defaultdict(list)
+    loaded = set()
+    for _ in range(runs):
+        rows = _importtime(code)
+        # drop what the bare interpreter imports at startup (site, encodings, ...)
+        top_level = [r for r in rows if r[2] == 0 and r[3] not in startup]
+        totals.append(sum(r[1] for r in top_level))
+        package_self = defaultdict(int)
+        for self_us, _, _, name in rows:
+            if name in startup:
+                continue
+            package_self[name.split(".")[0]] += self_us
+            loaded.add(name.split(".")[0])
+        for package, self_us in package_self.items():
+            by_package[package].append(self_us)
+
+    packages = {name: round(statistics.median(values) / 1000, 2) for name, values in by_package.items()}
+    return {
+        "median_ms": round(statistics.median(totals) / 1000, 2),
+        "min_ms": round(min(totals) / 1000, 2),
+        "runs": runs,
+        "heavy_loaded": sorted(p for p in HEAVY_PACKAGES if p in loaded),
+        "packages_ms": dict(sorted(packages.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report cold-start import time for each entry point")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per entry point")
+    parser.add_argument("--top", type=int, default=10, help="packages listed per entry point")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    startup = {r[3] for r in _importtime("pass")}
+    report = {}
+    for name, code in entry_points().items():
+        result = measure(code, startup, args.runs)
+        report[name] = result
+        print(f"\n{name}: {result['median_ms']} ms median (min {result['min_ms']} ms, {args.runs} runs)")
+        print(f"  heavy libraries loaded: {', '.join(result['heavy_loaded']) or 'none'}")
+        for package, ms in list(result["packages_ms"].items())[:args.top]:
+            print(f"  {package:<32} {ms:>9.2f} ms")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(LATEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        for name, result in report.items():
+            if name not in baseline:
+                continue
+            before, after = baseline[name]["median_ms"], result["median_ms"]
+            change = (after - before) / before if before else 0.0
+            flag = "  SLOWER" if change > REGRESSION_THRESHOLD else ""
+            print(f"{name:<12} {before:>9.2f} ms -> {after:>9.2f} ms ({change:+.0%}){flag}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""Headless load test for dashboard rerun latency.
+
+Drives modules/dashboard.py through Streamlit's AppTest with many concurrent
+simulated sessions. AppTest is not safe to run on several threads of one
+process, so every session gets a fresh worker process; the sessions share the
+history database, text cache and HTTP cache (in a temporary directory) the
+way server processes would. GitHub is replaced by a local stub server.
+
+    python -m benchmarks.load_test                        # 1, 5, 10 and 25 sessions
+    python -m benchmarks.load_test --sessions 1,10,50 --github-latency 50
+    python -m benchmarks.load_test --output benchmarks/results/load.json
+
+Each session uploads a resume, switches roles twice, enters a GitHub
+username, exports the PDF report and opens its history and the leaderboard.
+Every successful rerun is timed, and p50/p95/p99 latency and the peak RSS of
+the largest session process are reported per session count.
+"""
+import argparse
+import io
+import json
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+try:
+    from .synthetic import resume_docx, resume_pdf, synthetic_resume
+except ImportError:
+    from synthetic import resume_docx, resume_pdf, synthetic_resume
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES_DIR = os.path.join(_PROJECT_DIR, "modules")
+DASHBOARD = os.path.join(MODULES_DIR, "dashboard.py")
+
+# session_state key the patched st.file_uploader reads the simulated upload from
+UPLOAD_KEY = "_load_test_upload"
+RERUN_TIMEOUT_SECONDS = 120
+REPO_COUNT = 12
+LANGUAGES = ["Python", "JavaScript", "SQL", "Java", "HTML", "CSS", "Go", "Shell"]
+
+class _StubGitHub(BaseHTTPRequestHandler):
+    """The handful of GitHub API and web endpoints portfolio_analyzer calls."""
+
+    latency = 0.0
+    base_url = ""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body.encode("utf-8") if isinstance(body, str) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        seed = zlib.crc32(url.path.encode("utf-8"))
+
+        if parts[:2] == ["api", "users"] and len(parts) == 3:
+            return self._send(200, {"login": parts[2], "public_repos": REPO_COUNT, "followers": seed % 200})
+        if parts[:2] == ["api", "users"] and len(parts) == 4 and parts[3] == "repos":
+            query = parse_qs(url.query)
+            per_page = int(query.get("per_page", ["30"])[0])
+            page = int(query.get("page", ["1"])[0])
+            names = [f"repo{i:02d}" for i in range(REPO_COUNT)][(page - 1) * per_page:page * per_page]
+            return self._send(200, [{"name": name, "languages_url": f"{self.base_url}/api/repos/{parts[2]}/{name}/languages"}
+                                    for name in names])
+        if parts[:2] == ["api", "repos"] and len(parts) == 5 and parts[4] == "languages":
+            langs = [LANGUAGES[(seed + i) % len(LANGUAGES)] for i in range(3)]
+            return self._send(200, {lang: (seed >> (4 * i)) % 50000 + 1000 for i, lang in enumerate(langs)})
+        if parts[:2] == ["web", "users"] and len(parts) == 4 and parts[3] == "contributions":
+            return self._send(200, f"<h2>{seed % 1500} contributions in the last year</h2>", "text/html")
+        return self._send(404, {"message": "Not Found"})
+
+def start_stub_github(latency_ms: float = 0.0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHub)
+    server.daemon_threads = True
+    _StubGitHub.latency = latency_ms / 1000
+    _StubGitHub.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+class _Upload(io.BytesIO):
+    """Stands in for Streamlit's UploadedFile (name + bytes)."""
+
+    def __init__(self, name: str, data: bytes):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+
+def _patch_file_uploader():
+    # AppTest cannot drive st.file_uploader, so each session's upload is injected through session_state
+    import streamlit as st
+
+    def file_uploader(label, *args, **kwargs):
+        upload = st.session_state.get(UPLOAD_KEY)
+        return _Upload(*upload) if upload else None
+
+    st.file_uploader = file_uploader
+
+class _RssSampler:
+    """Tracks peak resident set size, from /proc when available, else getrusage."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, AttributeError):
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(-(-pct * len(ordered) // 100)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+def _widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"widget not found: {label!r}")
+
+def run_session(index: int, upload, roles: List[str], timings: Dict[str, List[float]], errors: List[str]):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(DASHBOARD, default_timeout=RERUN_TIMEOUT_SECONDS)
+    username = f"loaduser{index:04d}"
+
+    def step(name, action=None):
+        start = time.perf_counter()
+        try:
+            (action() if action else at).run()
+        except Exception as exc:
+            errors.append(f"session {index} {name}: {exc!r}")
+            return False
+        if at.exception:
+            errors.append(f"session {index} {name}: {at.exception[0].value}")
+            return False
+        timings.setdefault(name, []).append(time.perf_counter() - start)
+        return True
+
+    if not step("open"):
+        return
+    at.session_state[UPLOAD_KEY] = upload
+    if not step("upload"):
+        return
+    for offset in (1, 2):
+        role = roles[(index + offset) % len(roles)]
+        if not step("switch_role", lambda: _widget(at.selectbox, "Choose a job role:").set_value(role)):
+            return
+    if not step("github", lambda: _widget(at.text_input, "GitHub Username").set_value(username)):
+        return
+    if not step("export_pdf", lambda: _widget(at.button, "📄 Export combined PDF report").click()):
+        return
+    # a report still rendering in the background is polled the way a user would
+    for _ in range(10):
+        if any(b.label == "⬇️ Download Report" for b in at.get("download_button")):
+            break
+        if not step("report_status"):
+            return
+    history = "History: Enter GitHub username to view progress"
+    if not step("history", lambda: _widget(at.text_input, history).set_value(username)):
+        return
+    step("leaderboard")
+
+def _init_worker(env: Dict[str, str]):
+    os.environ.update(env)
+    if MODULES_DIR not in sys.path:
+        sys.path.insert(0, MODULES_DIR)
+    _patch_file_uploader()
+    # pay for the imports up front, as a running server would have, rather than in the first rerun
+    import streamlit.testing.v1  # noqa: F401
+    import dashboard_cache, report_generator, skill_history, ui_helpers  # noqa: F401,E401
+
+def _session_process(index: int, upload, roles: List[str]) -> dict:
+    timings: Dict[str, List[float]] = {}
+    errors: List[str] = []
+    started = time.time()
+    with _RssSampler() as rss:
+        run_session(index, upload, roles, timings, errors)
+    perf = sys.modules.get("perf")
+    return {"timings": timings, "errors": errors, "started": started, "finished": time.time(),
+            "peak_rss": rss.peak, "stages": perf.totals.snapshot()["stages"] if perf else {}}
+
+def _add_stages(totals: Dict[str, dict], stages: Dict[str, dict]):
+    for name, src in stages.items():
+        stage = totals.setdefault(name, {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        stage["calls"] += src["calls"]
+        stage["errors"] += src["errors"]
+        stage["total_seconds"] += src["total_seconds"]
+        stage["max_seconds"] = max(stage["max_seconds"], src["max_seconds"])
+
+def run_level(sessions: int, uploads, roles: List[str], env: Dict[str, str], stages: Dict[str, dict]) -> dict:
+    timings: Dict[str, List[float]] = {}
+    errors: List[str] = []
+    # spawn, and one session per process: no AppTest or Streamlit runtime state is shared or inherited
+    with ProcessPoolExecutor(max_workers=sessions, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(env,), max_tasks_per_child=1) as pool:
+        futures = [pool.submit(_session_process, i, uploads[i % len(uploads)], roles) for i in range(sessions)]
+        results = [future.result() for future in futures]
+    for result in results:
+        for name, values in result["timings"].items():
+            timings.setdefault(name, []).extend(values)
+        errors.extend(result["errors"])
+        _add_stages(stages, result["stages"])
+    # from the first session starting to the last one finishing, leaving out process start-up
+    elapsed = max(r["finished"] for r in results) - min(r["started"] for r in results)
+
+    latencies = [t for values in timings.values() for t in values]
+    ms = lambda seconds: round(seconds * 1000, 1)
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "seconds": round(elapsed, 2),
+        "reruns_per_second": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "max_ms": ms(max(latencies, default=0.0)),
+        "peak_rss_mb": round(max(r["peak_rss"] for r in results) / (1024 * 1024), 1),
+        "steps": {name: {"count": len(values), "p50_ms": ms(percentile(values, 50)),
+                         "p95_ms": ms(percentile(values, 95))} for name, values in sorted(timings.items())},
+    }
+
+def build_uploads(count: int, words: int) -> list:
+    """Distinct resumes (alternating PDF and DOCX) so sessions don't share cached results."""
+    uploads = []
+    for i in range(count):
+        text = synthetic_resume(words, seed=i)
+        if i % 2:
+            uploads.append((f"resume_{i}.docx", resume_docx(text)))
+        else:
+            uploads.append((f"resume_{i}.pdf", resume_pdf(text)))
+    return uploads
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test dashboard reruns with simulated sessions")
+    parser.add_argument("--sessions", default="1,5,10,25", help="comma-separated concurrent session counts")
+    parser.add_argument("--words", type=int, default=800, help="words per synthetic resume")
+    parser.add_argument("--github-latency", type=float, default=20.0, help="stub GitHub latency per request (ms)")
+    parser.add_argument("--output", help="also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+    levels = [int(n) for n in args.sessions.split(",") if n.strip()]
+
+    workdir = tempfile.mkdtemp(prefix="resume_load_test_")
+    server = start_stub_github(args.github_latency)
+    # set in each session process before the dashboard's modules are first imported
+    env = {
+        "GITHUB_API_URL": f"{_StubGitHub.base_url}/api",
+        "GITHUB_WEB_URL": f"{_StubGitHub.base_url}/web",
+        "ANALYSIS_HISTORY_DB": os.path.join(workdir, "analysis_history.db"),
+        "GITHUB_CACHE_PATH": os.path.join(workdir, "github_http.sqlite"),
+        "RESUME_TEXT_CACHE_DIR": os.path.join(workdir, "resume_text"),
+        "ROLE_RANKER_CACHE_DIR": os.path.join(workdir, "role_ranker"),
+    }
+    if MODULES_DIR not in sys.path:
+        sys.path.insert(0, MODULES_DIR)
+
+    from job_registry import get_registry
+
+    roles = list(get_registry().roles)
+    uploads = build_uploads(max(levels), args.words)
+
+    print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'reruns/s':>9} {'peak RSS MB':>12}")
+    results = []
+    stages: Dict[str, dict] = {}
+    try:
+        for sessions in levels:
+            level = run_level(sessions, uploads, roles, env, stages)
+            results.append(level)
+            print(f"{sessions:>8} {level['reruns']:>7} {level['errors']:>6} {level['p50_ms']:>9} {level['p95_ms']:>9} "
+                  f"{level['p99_ms']:>9} {level['reruns_per_second']:>9} {level['peak_rss_mb']:>12}", flush=True)
+            for sample in level["error_samples"]:
+                print(f"    ! {sample}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"levels": results, "stages": stages}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
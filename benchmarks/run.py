@@ -0,0 +1,266 @@
+"""Microbenchmarks for every analysis stage.
+
+Run from the project root:
+
+    python -m benchmarks.run                   # full run, compared against the saved baseline
+    python -m benchmarks.run --quick           # fewer sizes and repeats
+    python -m benchmarks.run --only scores     # stages whose name contains "scores"
+    python -m benchmarks.run --save-baseline   # store this run as the new baseline
+
+Every run writes benchmarks/results/latest.json. Memoized stages are timed
+cold (their caches are cleared before each call), so the numbers reflect the
+work done on a first render rather than a cache lookup.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List
+
+try:
+    from .synthetic import (resume_docx, resume_pdf, synthetic_history, synthetic_job_roles,
+                            synthetic_resume)
+except ImportError:
+    from synthetic import resume_docx, resume_pdf, synthetic_history, synthetic_job_roles, synthetic_resume
+
+from modules import charts, job_registry, storage_manager
+from modules.ats_score import get_all_scores
+from modules.feedback import generate_feedback
+from modules.keyword_analysis import analyze_keywords
+from modules.nlp_analysis import extract_keywords, get_document, get_skill_frequencies
+from modules.report_generator import generate_pdf_report
+from modules.resume_parser import clean_text, extract_text_from_docx, extract_text_from_pdf
+from modules.role_ranker import RoleRanker
+from modules.skill_matcher import _scan
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "baseline.json")
+LATEST_PATH = os.path.join(RESULTS_DIR, "latest.json")
+
+FULL = {"words": (200, 1000, 5000, 20000), "parse_words": (200, 1000, 5000), "roles": (5, 50, 500),
+        "history": (1000, 10000, 100000), "repeat": 5}
+QUICK = {"words": (200, 1000), "parse_words": (200, 1000), "roles": (5, 50), "history": (1000, 10000),
+         "repeat": 3}
+
+# a stage is slower than its baseline when its median grows by more than this fraction
+REGRESSION_THRESHOLD = 0.25
+MIN_SAMPLE_SECONDS = 0.05
+
+_HISTORY_STAGES = ("get_user_history", "get_user_history_page", "get_leaderboard", "save_analysis",
+                   "recalc_all_points")
+
+def _cold():
+    _scan.cache_clear()
+    get_document.cache_clear()
+    charts.clear_cache()
+
+def measure(fn: Callable, repeat: int = 5, min_time: float = MIN_SAMPLE_SECONDS) -> dict:
+    """Per-call timings in ms: `repeat` samples, each looping `fn` long enough to be measurable."""
+    fn()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {"median_ms": round(statistics.median(samples) * 1000, 4), "min_ms": round(min(samples) * 1000, 4),
+            "loops": number, "repeat": repeat}
+
+@contextmanager
+def job_roles(roles: Dict[str, List[str]]):
+    """Point the default job registry at a temporary job_descriptions.json holding `roles`."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "job_descriptions.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(roles, f)
+        with job_registry.use_registry(job_registry.JobRegistry([path], write_default=False, shared=True)):
+            yield
+
+@contextmanager
+def history_db(rows: int):
+    """A throwaway analysis_history.db seeded with `rows` synthetic analyses."""
+    original = storage_manager.DB_NAME
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_manager.DB_NAME = os.path.join(tmp, "analysis_history.db")
+        try:
+            storage_manager.init_db()
+            storage_manager.save_analyses(synthetic_history(rows))
+            yield
+        finally:
+            storage_manager.close_connection()
+            storage_manager.DB_NAME = original
+
+class Suite:
+    def __init__(self, params: dict, only: str = None):
+        self.params = params
+        self.only = only
+        self.results: Dict[str, dict] = {}
+
+    def bench(self, name: str, fn: Callable):
+        if self.only and self.only not in name:
+            return
+        self.results[name] = measure(fn, self.params["repeat"])
+        print(f"{name:<48} {self.results[name]['median_ms']:>12.3f} ms", flush=True)
+
+    def text_stages(self):
+        keywords = job_registry.get_registry().roles.get("Data Scientist") or next(iter(
+            job_registry.get_registry().roles.values()))
+        for words in self.params["words"]:
+            raw = synthetic_resume(words)
+            text = clean_text(raw)
+            result = analyze_keywords(text, keywords)
+
+            def cold(fn, *args):
+                def call():
+                    _cold()
+                    fn(*args)
+                return call
+
+            self.bench(f"clean_text[words={words}]", lambda: clean_text(raw))
+            self.bench(f"analyze_keywords[words={words}]", cold(analyze_keywords, text, keywords))
+            self.bench(f"get_all_scores[words={words}]", cold(get_all_scores, text))
+            self.bench(f"extract_keywords[words={words}]", cold(extract_keywords, text))
+            self.bench(f"get_skill_frequencies[words={words}]", cold(get_skill_frequencies, text))
+            self.bench(f"generate_feedback[words={words}]",
+                       lambda: generate_feedback(result.found, result.missing))
+
+    def parse_stages(self):
+        for words in self.params["parse_words"]:
+            text = synthetic_resume(words)
+            pdf, docx_bytes = resume_pdf(text), resume_docx(text)
+            self.bench(f"extract_text_from_pdf[words={words}]", lambda: extract_text_from_pdf(io.BytesIO(pdf)))
+            self.bench(f"extract_text_from_docx[words={words}]",
+                       lambda: extract_text_from_docx(io.BytesIO(docx_bytes)))
+
+    def role_scaling(self):
+        text = clean_text(synthetic_resume(1000))
+        for count in self.params["roles"]:
+            roles = synthetic_job_roles(count)
+            with job_roles(roles):
+                def call():
+                    _cold()
+                    get_all_scores(text)
+                self.bench(f"get_all_scores[roles={count}]", call)
+            ranker = RoleRanker.build(roles)
+            self.bench(f"rank_roles[roles={count}]", lambda: ranker.rank(text, 5))
+
+    def history_scaling(self):
+        for rows in self.params["history"]:
+            # seeding a large table is slow, so skip it when --only excludes every storage stage
+            if self.only and not any(self.only in f"{stage}[rows={rows}]" for stage in _HISTORY_STAGES):
+                continue
+            with history_db(rows):
+                self.bench(f"get_user_history[rows={rows}]", lambda: storage_manager.get_user_history("user007"))
+                self.bench(f"get_user_history_page[rows={rows}]",
+                           lambda: storage_manager.get_user_history_page("user007", limit=50))
+                self.bench(f"get_leaderboard[rows={rows}]", storage_manager.get_leaderboard)
+                self.bench(f"save_analysis[rows={rows}]",
+                           lambda: storage_manager.save_analysis("user007", "Data Scientist", 72.5, 12, 30, 450))
+                self.bench(f"recalc_all_points[rows={rows}]", storage_manager.recalc_all_points)
+
+    def report_stage(self):
+        text = clean_text(synthetic_resume(1000))
+        result = analyze_keywords(text, ["Python", "SQL", "Machine Learning", "Pandas", "Kubernetes"])
+        feedback = generate_feedback(result.found, result.missing)
+        skills = get_skill_frequencies(text)
+        portfolio = {"username": "octocat", "repositories": 42, "followers": 100, "contributions": 512,
+                     "top_languages": {"Python": 120000, "JavaScript": 40000, "SQL": 9000}}
+
+        def call():
+            _cold()
+            generate_pdf_report("Data Scientist", result, feedback, 66.67, portfolio, skills)
+
+        self.bench("generate_pdf_report", call)
+
+    def run(self) -> Dict[str, dict]:
+        self.text_stages()
+        self.parse_stages()
+        self.role_scaling()
+        self.history_scaling()
+        self.report_stage()
+        return self.results
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              timeout=10).stdout.strip()
+    except Exception:
+        return ""
+
+def compare(results: Dict[str, dict], baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Print each stage against the baseline and return the names that got slower than `threshold`."""
+    regressions = []
+    base = baseline.get("results", {})
+    print(f"\n{'stage':<48} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        if name not in base:
+            continue
+        before, after = base[name]["median_ms"], current["median_ms"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  SLOWER"
+        print(f"{name:<48} {before:>10.3f}ms {after:>10.3f}ms {change:>+7.0%}{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark each resume analysis stage")
+    parser.add_argument("--quick", action="store_true", help="fewer sizes and repeats")
+    parser.add_argument("--only", help="run only stages whose name contains this text")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="median slowdown (fraction) reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any stage regressed")
+    args = parser.parse_args(argv)
+
+    params = QUICK if args.quick else FULL
+    results = Suite(params, args.only).run()
+    report = {
+        "meta": {"date": datetime.now().isoformat(timespec="seconds"), "commit": _git_commit(),
+                 "python": platform.python_version(), "platform": platform.platform(),
+                 "cpus": os.cpu_count(), "quick": args.quick},
+        "results": results,
+    }
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(LATEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    regressions = []
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("platform") != report["meta"]["platform"]:
+            print("\nnote: baseline was recorded on a different platform")
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\n{len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}")
+
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import io
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+# Deterministic synthetic inputs for the benchmarks: the same (size, seed) always yields
+# the same resume text, job roles and history rows, so runs are comparable offline.
+
+SECTIONS = ["Summary", "Skills", "Experience", "Projects", "Education", "Certifications"]
+
+SKILLS = ["Python", "Java", "SQL", "Machine Learning", "Deep Learning", "Django", "Flask", "APIs",
+          "Spring Boot", "Hibernate", "Microservices", "Pandas", "Numpy", "TensorFlow", "Scikit-learn",
+          "JavaScript", "React", "Node.js", "MongoDB", "Express", "MERN", "Docker", "AWS", "HTML", "CSS",
+          "Matplotlib", "C++", "Git", "Kubernetes", "PostgreSQL"]
+
+_FILLER = ["developed", "designed", "implemented", "maintained", "improved", "led", "team", "project",
+           "system", "service", "data", "pipeline", "users", "performance", "reliability", "feature",
+           "customer", "platform", "application", "testing", "deployment", "analysis", "reporting",
+           "dashboard", "integration", "production", "scalable", "efficient", "reduced", "latency",
+           "increased", "throughput", "collaborated", "stakeholders", "delivered", "the", "and", "with",
+           "for", "using", "across", "within", "weekly", "monthly", "automated", "workflow", "model"]
+
+SKILL_RATE = 0.08
+
+def synthetic_resume(words: int = 600, seed: int = 0) -> str:
+    """Raw resume-like text of about `words` words, with the uneven spacing real extractions have."""
+    rng = random.Random(seed)
+    lines = ["Jane Doe", "jane.doe@example.com  |  +1 555 0100", ""]
+    count = 0
+    while count < words:
+        for section in SECTIONS:
+            lines.extend(["", section.upper(), ""])
+            for _ in range(rng.randint(3, 8)):
+                line = []
+                for _ in range(rng.randint(6, 16)):
+                    line.append(rng.choice(SKILLS) if rng.random() < SKILL_RATE else rng.choice(_FILLER))
+                count += len(line)
+                lines.append("  - " + "  ".join(line) + "   ")
+                if rng.random() < 0.2:
+                    lines.append("   ")
+                if count >= words:
+                    break
+            if count >= words:
+                break
+    return "\n".join(lines)
+
+def synthetic_job_roles(count: int, keywords_per_role: int = 6, seed: int = 0) -> Dict[str, List[str]]:
+    """`count` roles drawing on the real skill names plus generated ones, so the vocabulary grows with the role count."""
+    rng = random.Random(seed)
+    pool = SKILLS + [f"Skill{i:04d}" for i in range(count * 2)]
+    return {f"Role {i:04d}": rng.sample(pool, keywords_per_role) for i in range(count)}
+
+def synthetic_history(rows: int, users: int = 50, roles: List[str] = None, seed: int = 0) -> List[dict]:
+    """Rows in the shape `storage_manager.save_analyses` takes, spread over the last year."""
+    rng = random.Random(seed)
+    roles = roles or ["Python Developer", "Data Scientist", "Java Developer"]
+    start = datetime(2025, 1, 1)
+    return [{
+        "username": f"user{rng.randrange(users):03d}",
+        "role": rng.choice(roles),
+        "ats_score": round(rng.uniform(0, 100), 2),
+        "repos": rng.randint(0, 80),
+        "followers": rng.randint(0, 500),
+        "contributions": rng.randint(0, 2000),
+        "date": (start + timedelta(seconds=rng.randrange(365 * 86400))).strftime("%Y-%m-%d %H:%M:%S"),
+    } for _ in range(rows)]
+
+def resume_pdf(text: str) -> bytes:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+    buf = io.BytesIO()
+    # invariant drops the creation date and document id, so the same text gives the same bytes
+    doc = SimpleDocTemplate(buf, pagesize=A4, invariant=1)
+    normal = getSampleStyleSheet()["Normal"]
+    content = [Paragraph(escape(line), normal) if line.strip() else Spacer(1, 6) for line in text.splitlines()]
+    doc.build(content)
+    return buf.getvalue()
+
+def resume_docx(text: str) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buf = io.BytesIO()
+    document.save(buf)
+    return buf.getvalue()
+
+def write_fixtures(directory: str, sizes=(200, 1000, 5000), seed: int = 0) -> List[str]:
+    """Write resume_<words>.pdf / .docx for each size and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for words in sizes:
+        text = synthetic_resume(words, seed)
+        for ext, render in (("pdf", resume_pdf), ("docx", resume_docx)):
+            path = os.path.join(directory, f"resume_{words}.{ext}")
+            with open(path, "wb") as f:
+                f.write(render(text))
+            paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join("benchmarks", "fixtures")
+    for path in write_fixtures(target):
+        print(path)
@@ -1,41 +1,80 @@
+import argparse
 import os
-from modules.resume_parser import extract_text_from_pdf, extract_text_from_docx
+from modules.resume_parser import extract_resume_text
 from modules.keyword_analysis import analyze_keywords
-from modules.ats_score import get_all_scores
+from modules.ats_score import get_all_scores, recommend_roles
+from modules.role_ranker import rank_roles
 from modules.portfolio_analyzer import analyze_github_profile
 
-resume_file = "data/resumes/sample_resume.pdf"
-
-if not os.path.exists(resume_file):
-    raise FileNotFoundError(f"File not found: {resume_file}")
-
-if resume_file.endswith(".pdf"):
-    resume_text = extract_text_from_pdf(resume_file)
-elif resume_file.endswith(".docx"):
-    resume_text = extract_text_from_docx(resume_file)
-else:
-    raise ValueError("Unsupported file format. Use PDF or DOCX.")
-
-keywords = ["Python", "Java", "SQL", "Machine Learning", "Django", "MERN"]
-result = analyze_keywords(resume_text, keywords)
-
-print("\n🔎 Keyword Analysis")
-print("✅ Keywords Found:", result["found"])
-print("❌ Keywords Missing:", result["missing"])
-
-print("\n📊 ATS Scores by Job Role")
-scores = get_all_scores(resume_text)
-for job, score in scores.items():
-    print(f"- {job}: {score}%")
-
-print("\n🌐 Portfolio Analysis (GitHub)")
-github_username = input("Enter GitHub username: ")
-github_stats = analyze_github_profile(github_username)
-
-if "error" in github_stats:
-    print("❌", github_stats["error"])
-else:
-    print(f"GitHub Username: {github_stats['username']}")
-    print(f"Repositories: {github_stats['repositories']}")
-    print(f"Followers: {github_stats['followers']}")
-    print(f"Contributions (this year): {github_stats['contributions']}")
\ No newline at end of file
+DEFAULT_RESUME = "data/resumes/sample_resume.pdf"
+
+def analyze_single(resume_file, github_username=None):
+    if not os.path.exists(resume_file):
+        raise FileNotFoundError(f"File not found: {resume_file}")
+
+    resume_text = extract_resume_text(resume_file)
+
+    keywords = ["Python", "Java", "SQL", "Machine Learning", "Django", "MERN"]
+    result = analyze_keywords(resume_text, keywords)
+
+    print("\n🔎 Keyword Analysis")
+    print("✅ Keywords Found:", result.found)
+    print("❌ Keywords Missing:", result.missing)
+
+    print("\n📊 ATS Scores by Job Role")
+    scores = get_all_scores(resume_text)
+    for job, score in scores.items():
+        print(f"- {job}: {score}%")
+
+    print("\n🏅 Best-fit Roles")
+    best_fit = recommend_roles(resume_text, top_k=3)
+    if best_fit:
+        for rank, (job, score) in enumerate(best_fit, start=1):
+            print(f"{rank}. {job}: {score}%")
+    else:
+        print("No role shares a skill with this resume yet.")
+
+    print("\n🧭 Closest Roles by Description")
+    similar = [(job, similarity) for job, similarity in rank_roles(resume_text, top_k=3) if similarity > 0]
+    if similar:
+        for rank, (job, similarity) in enumerate(similar, start=1):
+            print(f"{rank}. {job}: {similarity}% similar")
+    else:
+        print("No role description shares a word with this resume.")
+
+    print("\n🌐 Portfolio Analysis (GitHub)")
+    if github_username is None:
+        github_username = input("Enter GitHub username: ")
+    github_stats = analyze_github_profile(github_username)
+
+    if "error" in github_stats:
+        print("❌", github_stats["error"])
+    else:
+        print(f"GitHub Username: {github_stats['username']}")
+        print(f"Repositories: {github_stats['repositories']}")
+        print(f"Followers: {github_stats['followers']}")
+        print(f"Contributions (this year): {github_stats['contributions']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume & Portfolio Analyzer")
+    parser.add_argument("resume", nargs="?", default=DEFAULT_RESUME, help="resume to analyze (PDF/DOCX)")
+    parser.add_argument("--github", help="GitHub username (skips the interactive prompt)")
+    parser.add_argument("--batch", metavar="DIR", help="score every PDF/DOCX under DIR non-interactively")
+    parser.add_argument("--output", default="batch_results.jsonl", help="batch output file (.jsonl or .csv)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="batch output format (default: from --output)")
+    parser.add_argument("--workers", type=int, help="batch worker processes (default: CPU count)")
+    parser.add_argument("--checkpoint", help="batch checkpoint file (default: <output>.checkpoint)")
+    args = parser.parse_args()
+
+    if args.batch:
+        from modules.batch_runner import run_batch
+
+        summary = run_batch(args.batch, args.output, fmt=args.format, workers=args.workers,
+                            checkpoint_path=args.checkpoint)
+        print(f"✅ Scored {summary['scored']} resumes, ❌ {summary['errors']} errors, "
+              f"⏭️ {summary['skipped']} already done → {args.output}")
+    else:
+        analyze_single(args.resume, args.github)
+
+if __name__ == "__main__":
+    main()
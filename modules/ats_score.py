@@ -1,54 +1,77 @@
-import json
-import os
+import heapq
+from collections import Counter
 
-DEFAULT_JOB_DATA = {
-    "Python Developer": ["Python", "Django", "Flask", "SQL", "APIs"],
-    "Java Developer": ["Java", "Spring Boot", "Hibernate", "Microservices", "SQL"],
-    "Data Scientist": ["Python", "Machine Learning", "Pandas", "Numpy", "SQL", "Deep Learning"],
-    "Full Stack Developer": ["JavaScript", "React", "Node.js", "MongoDB", "Express", "MERN"],
-    "Machine Learning Engineer": ["Python", "TensorFlow", "Scikit-learn", "Machine Learning", "Deep Learning"]
-}
+try:
+    from .job_registry import DEFAULT_JOB_DATA, get_registry
+    from .perf import traced
+    from .skill_matcher import find_keywords
+except ImportError:
+    from job_registry import DEFAULT_JOB_DATA, get_registry
+    from perf import traced
+    from skill_matcher import find_keywords
 
 def load_job_descriptions():
+    """Role -> keywords mapping from the shared registry (re-read only when the file changes)."""
+    return get_registry().roles
 
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    candidates = [
-        os.path.join(current_dir, "job_descriptions.json"),
-        os.path.join(current_dir, "data", "job_descriptions.json"),
-        os.path.join(current_dir, "data", "job_descriptions", "job_descriptions.json"),
-        os.path.join(os.path.dirname(current_dir), "data", "job_descriptions", "job_descriptions.json"),
-        os.path.join(os.path.dirname(current_dir), "job_descriptions.json"),]
-
-    for p in candidates:
-        p = os.path.normpath(p)
-        if os.path.exists(p):
-            with open(p, "r", encoding="utf-8") as f:
-                try:
-                    return json.load(f)
-                except Exception:
-                    pass
-
-    target = os.path.join(current_dir, "job_descriptions.json")
-    os.makedirs(os.path.dirname(target), exist_ok=True)
-    with open(target, "w", encoding="utf-8") as f:
-        json.dump(DEFAULT_JOB_DATA, f, indent=4)
-
-    return DEFAULT_JOB_DATA
+def _score_keywords(hits, keywords):
+    if not keywords:
+        return 0
+    found = sum(1 for kw in keywords if kw in hits)
+    score = (found / len(keywords)) * 100
+    return round(score, 2)
 
+@traced
 def calculate_ats_score(resume_text, job_title):
     """Calculate ATS score for a specific job role (0-100)."""
-    job_data = load_job_descriptions()
-    keywords = job_data.get(job_title, [])
+    registry = get_registry()
+    keywords = registry.index.get(job_title, ())
     if not keywords:
         return 0
-    found = sum(1 for kw in keywords if kw.lower() in resume_text.lower())
-    score = (found / len(keywords)) * 100
-    return round(score, 2)
+    return _score_keywords(find_keywords(resume_text, registry.matcher), keywords)
 
+@traced
 def get_all_scores(resume_text):
-    job_data = load_job_descriptions()
+    registry = get_registry()
+    # one scan of the resume serves every role
+    hits = find_keywords(resume_text, registry.matcher)
     scores = {}
-    for job in job_data:
-        scores[job] = calculate_ats_score(resume_text, job)
-    return scores
\ No newline at end of file
+    for job, keywords in registry.index.items():
+        scores[job] = _score_keywords(hits, keywords)
+    return scores
+
+@traced
+def recommend_roles(resume_text, top_k=3):
+    """Best-fit roles as (role, ATS score) pairs, highest score first.
+
+    Only roles sharing at least one detected skill are scored, found through
+    the registry's skill -> roles index, so the cost follows the resume's
+    skills rather than the number of roles. Scores equal `calculate_ats_score`;
+    ties keep the job file's role order.
+    """
+    if top_k <= 0:
+        return []
+    registry = get_registry()
+    hits = find_keywords(resume_text, registry.matcher)
+    skill_roles = registry.skill_roles
+    found = Counter()
+    for skill in hits:
+        for role in skill_roles.get(skill, ()):
+            found[role] += 1
+
+    index, order = registry.index, registry.role_order
+    heap = []
+    perfect = 0
+    for role in sorted(found, key=order.__getitem__):
+        score = round((found[role] / len(index[role])) * 100, 2)
+        item = (score, -order[role], role)
+        if len(heap) < top_k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+        if score == 100:
+            perfect += 1
+            # roles later in the file can at best tie, and ties go to the earlier role
+            if perfect >= top_k:
+                break
+    return [(role, score) for score, _, role in sorted(heap, reverse=True)]
@@ -0,0 +1,158 @@
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Iterator, List, Optional, Set
+
+try:
+    from .resume_parser import extract_resume_text
+    from .score_matrix import get_score_matrix
+except ImportError:
+    from resume_parser import extract_resume_text
+    from score_matrix import get_score_matrix
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+# files per worker task: scored together with one matrix product
+CHUNK_SIZE = 8
+
+def iter_resume_files(root: str) -> Iterator[str]:
+    """Yield PDF/DOCX files under `root` in a stable (sorted) order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+def score_resume_files(paths: List[str]) -> List[dict]:
+    """Parse a group of resumes and score them together; errors are returned in the records, never raised."""
+    records, texts = [], []
+    for path in paths:
+        try:
+            texts.append(extract_resume_text(path))
+            records.append({"file": path, "scores": {}, "error": None})
+        except Exception as e:
+            records.append({"file": path, "scores": {}, "error": f"{type(e).__name__}: {e}"})
+    if texts:
+        parsed = [record for record in records if record["error"] is None]
+        try:
+            for record, scores in zip(parsed, get_score_matrix().score_dicts(texts)):
+                record["scores"] = scores
+        except Exception as e:
+            for record in parsed:
+                record["error"] = f"{type(e).__name__}: {e}"
+    return records
+
+def load_checkpoint(path: str) -> Set[str]:
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+class _ResultWriter:
+    """Appends results as JSONL (one line per resume) or CSV (one row per resume/role)."""
+
+    def __init__(self, path: str, fmt: str):
+        self.fmt = fmt
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", encoding="utf-8", newline="")
+        if fmt == "csv":
+            self._csv = csv.writer(self._file)
+            if is_new:
+                self._csv.writerow(["file", "role", "ats_score", "error"])
+
+    def write(self, record: dict):
+        if self.fmt == "csv":
+            if record["error"]:
+                self._csv.writerow([record["file"], "", "", record["error"]])
+            for role, score in record["scores"].items():
+                self._csv.writerow([record["file"], role, score, ""])
+        else:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def _report(done, total, errors, started, stream):
+    elapsed = time.time() - started
+    rate = done / elapsed if elapsed > 0 else 0.0
+    stream.write(f"\r[{done}/{total}] {errors} errors, {rate:.1f} resumes/s")
+    stream.flush()
+
+def _results(future, paths: List[str]) -> List[dict]:
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        return [{"file": path, "scores": {}, "error": f"{type(e).__name__}: {e}"} for path in paths]
+
+def run_batch(input_dir: str, output_path: str, fmt: Optional[str] = None, workers: Optional[int] = None,
+              checkpoint_path: Optional[str] = None, progress=sys.stderr) -> dict:
+    """Score every resume under `input_dir` across a process pool, streaming results to `output_path`.
+
+    Successfully scored files are appended to the checkpoint, so re-running the
+    same command after an interruption skips them and appends to the same
+    output. Files that failed are not checkpointed and are retried on the next run.
+    """
+    if fmt is None:
+        fmt = "csv" if output_path.lower().endswith(".csv") else "jsonl"
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError("Unsupported output format. Use jsonl or csv.")
+    workers = workers or os.cpu_count() or 1
+    checkpoint_path = checkpoint_path or output_path + ".checkpoint"
+
+    done_files = load_checkpoint(checkpoint_path)
+    all_files = list(iter_resume_files(input_dir))
+    pending = [p for p in all_files if p not in done_files]
+    total = len(pending)
+    summary = {"total": total, "skipped": len(all_files) - total, "scored": 0, "errors": 0}
+    if not pending:
+        return summary
+
+    writer = _ResultWriter(output_path, fmt)
+    started = time.time()
+    queue = iter(pending)
+    in_flight = {}
+    pool = ProcessPoolExecutor(max_workers=workers)
+
+    def fill():
+        # keep a bounded window of submitted chunks so huge trees don't pile up futures
+        while len(in_flight) < workers * 2:
+            chunk = list(islice(queue, CHUNK_SIZE))
+            if not chunk:
+                return
+            in_flight[pool.submit(score_resume_files, chunk)] = chunk
+
+    try:
+        with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+            fill()
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in finished):
+                    # a worker died (OOM, crash inside a parser) and took the pool down with it: every
+                    # chunk still in flight fails, and the run continues on a fresh pool
+                    finished, _ = wait(in_flight)
+                    pool.shutdown(wait=False)
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                for future in finished:
+                    for record in _results(future, in_flight.pop(future)):
+                        writer.write(record)
+                        if record["error"]:
+                            summary["errors"] += 1
+                        else:
+                            checkpoint.write(record["file"] + "\n")
+                            summary["scored"] += 1
+                    checkpoint.flush()
+                fill()
+                if progress is not None:
+                    _report(summary["scored"] + summary["errors"], total, summary["errors"], started, progress)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        writer.close()
+        if progress is not None:
+            progress.write("\n")
+    return summary
@@ -0,0 +1,130 @@
+import hashlib
+import io
+import json
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+try:
+    from .perf import cache_event, trace
+except ImportError:
+    from perf import cache_event, trace
+
+# Charts are drawn from plain data on standalone Figure objects (never pyplot's global
+# figure registry), rendered to PNG, and released immediately. The PNG is memoized by a
+# hash of the chart inputs, so a rerun with unchanged data draws nothing.
+
+MAX_CACHED_CHARTS = 64
+
+_png_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_lock = threading.Lock()
+_live_figures = 0
+stats = {"hits": 0, "misses": 0}
+
+def _chart_key(kind: str, payload: dict) -> str:
+    raw = json.dumps([kind, payload], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _render(kind: str, payload: dict, figsize, draw: Callable, dpi: int = 100) -> bytes:
+    global _live_figures
+    key = _chart_key(kind, dict(payload, figsize=figsize, dpi=dpi))
+    with _lock:
+        png = _png_cache.get(key)
+        if png is not None:
+            _png_cache.move_to_end(key)
+            stats["hits"] += 1
+            cache_event("charts", True)
+            return png
+        stats["misses"] += 1
+        _live_figures += 1
+    cache_event("charts", False)
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    try:
+        with trace(f"charts.{kind}"):
+            draw(fig.add_subplot())
+            fig.tight_layout()
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=dpi)
+            png = buf.getvalue()
+    finally:
+        fig.clear()
+        with _lock:
+            _live_figures -= 1
+
+    with _lock:
+        _png_cache[key] = png
+        while len(_png_cache) > MAX_CACHED_CHARTS:
+            _png_cache.popitem(last=False)
+    return png
+
+def live_figure_count() -> int:
+    """Figures currently alive: ones being rendered here plus any left open in pyplot."""
+    count = _live_figures
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        count += len(pyplot.get_fignums())
+    return count
+
+def clear_cache():
+    with _lock:
+        _png_cache.clear()
+
+def skill_strength_chart(skills: Sequence[str], counts: Sequence[int], figsize=(6, 4)) -> bytes:
+    skills, counts = list(skills), list(counts)
+
+    def draw(ax):
+        ax.barh(skills, counts)
+        ax.invert_yaxis()
+        ax.set_xlabel("Frequency")
+        ax.set_ylabel("Skill")
+        ax.set_title("Skill Strength in Resume")
+
+    return _render("skill_strength", {"skills": skills, "counts": counts}, figsize, draw)
+
+def pie_chart(labels: Sequence[str], values: Sequence[float], title: str = None, figsize=(6.4, 4.8),
+              startangle: int = 90, dpi: int = 100, title_size: int = None) -> bytes:
+    labels, values = list(labels), list(values)
+
+    def draw(ax):
+        ax.pie(values, labels=labels, autopct="%1.1f%%", startangle=startangle)
+        ax.axis("equal")
+        if title:
+            ax.set_title(title, **({"fontsize": title_size} if title_size else {}))
+
+    return _render("pie", {"labels": labels, "values": values, "title": title, "startangle": startangle,
+                           "title_size": title_size}, figsize, draw, dpi)
+
+def language_bar_chart(languages: Sequence[str], lines: Sequence[int], title: str = "GitHub Language Distribution",
+                       figsize=(6.4, 4.8), dpi: int = 100, font_size: int = None, plain_y: bool = False) -> bytes:
+    languages, lines = list(languages), list(lines)
+
+    def draw(ax):
+        label_kw = {"fontsize": font_size} if font_size else {}
+        ax.bar(languages, lines)
+        ax.set_xlabel("Languages", **label_kw)
+        ax.set_ylabel("Lines of Code", **label_kw)
+        if title:
+            ax.set_title(title, **({"fontsize": font_size + 1} if font_size else {}))
+        ax.tick_params(axis="x", labelrotation=45, **({"labelsize": font_size - 1} if font_size else {}))
+        if plain_y:
+            ax.ticklabel_format(style="plain", axis="y")
+
+    return _render("language_bar", {"languages": languages, "lines": lines, "title": title,
+                                    "font_size": font_size, "plain_y": plain_y}, figsize, draw, dpi)
+
+def ats_trend_chart(dates: Sequence, scores: Sequence[float], figsize=(6, 4)) -> bytes:
+    dates, scores = list(dates), list(scores)
+
+    def draw(ax):
+        ax.plot(dates, scores, marker="o", linestyle="-", color="royalblue", linewidth=2)
+        ax.set_xlabel("Date")
+        ax.set_ylabel("ATS Score")
+        ax.set_title("ATS Score Over Time")
+        ax.tick_params(axis="x", labelrotation=45)
+        ax.grid(True, linestyle="--", alpha=0.5)
+
+    return _render("ats_trend", {"dates": dates, "scores": scores}, figsize, draw)
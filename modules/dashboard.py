@@ -1,17 +1,27 @@
 import streamlit as st
-from resume_parser import extract_text_from_pdf, extract_text_from_docx
-from keyword_analysis import analyze_keywords
 from feedback import generate_feedback
-from ats_score import calculate_ats_score
-from ui_helpers import (display_resume_preview, display_keyword_analysis, display_feedback, show_summary, load_job_roles, select_job_role, display_portfolio_feedback, show_wordcloud)
-from report_generator import generate_pdf_report
-from portfolio_analyzer import analyze_github_profile
-from storage_manager import (init_db, save_analysis, get_user_history, get_leaderboard, recalc_all_points)
-from nlp_analysis import extract_keywords, generate_wordcloud_bytes, get_top_skills, get_skill_frequencies, calculate_skill_match_percentage
-import pandas as pd
-import matplotlib.pyplot as plt
+from keyword_analysis import KeywordResult
+from ui_helpers import (display_resume_preview, display_keyword_analysis, display_feedback, show_summary, load_job_roles, select_job_role, display_portfolio_feedback, show_wordcloud, show_performance_panel, skill_frame)
+from report_generator import submit_pdf_report, report_filename
+from storage_manager import (init_db, save_analysis, get_user_history_page, get_leaderboard, recalc_all_points, clear_user_history)
+from skill_history import rescore_history, resume_skill_bits
+from dashboard_cache import (load_uploaded_resume, jobs_version, cached_keyword_analysis, cached_ats_score, cached_role_recommendations, cached_similar_roles, cached_skill_match, cached_nlp_insights, cached_wordcloud, cached_github_profile)
+import charts
+import perf
+import os
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import wait
+
+REPORT_WAIT_SECONDS = 3
+
+# heavy libraries (pandas, pdfplumber, python-docx, reportlab, requests) are imported by
+# the code paths that need them, so a cold start only pays for what the user touches
+
+# every traced stage below records into this rerun's breakdown and, as it happens, into the
+# session totals, so reruns cut short by st.rerun() are still counted
+perf_session = st.session_state.setdefault("perf_session", perf.Recorder())
+perf_run = perf.start_run(parent=perf_session)
 
 init_db()
 try:
@@ -20,10 +30,19 @@ except Exception:
     pass
 
 st.set_page_config(page_title="Resume & Portfolio Analyzer", layout="wide")
+
+try:
+    # no-op unless the job descriptions changed since the last run
+    rescored = rescore_history()
+    if rescored.skipped:
+        st.info(f"ℹ️ {rescored.skipped} saved analyses keep their previous score until their resume "
+                "is analyzed again (its extracted text is no longer cached).")
+except Exception as exc:
+    st.warning(f"⚠️ Could not re-score saved analyses for the updated job descriptions: {exc}")
 st.title("🎓 Resume & Portfolio Analyzer")
 st.write("Welcome! Upload your resume to get started.")
 
-for k in ["resume_text", "role", "result", "feedback", "ats_score", "last_saved_profile", "portfolio_data"]:
+for k in ["resume_text", "resume_hash", "role", "result", "feedback", "ats_score", "last_saved_profile", "portfolio_data"]:
     if k not in st.session_state:
         st.session_state[k] = None
 
@@ -43,15 +62,17 @@ with tab_resume:
 
     if uploaded_file is not None:
         file_type = uploaded_file.name.split(".")[-1].lower()
-        if file_type == "pdf":
-            resume_text = extract_text_from_pdf(uploaded_file)
-        elif file_type == "docx":
-            resume_text = extract_text_from_docx(uploaded_file)
+        resume_hash = None
+        if file_type in ("pdf", "docx"):
+            resume_hash, resume_text = load_uploaded_resume(uploaded_file)
         else:
             st.error("Unsupported file type!")
 
         if resume_text:
             st.session_state["resume_text"] = resume_text
+            st.session_state["resume_hash"] = resume_hash
+            version = jobs_version()
+            insights = cached_nlp_insights(resume_hash, resume_text)
 
             # preview
             with st.expander("📝 Resume Preview", expanded=False):
@@ -61,21 +82,24 @@ with tab_resume:
             job_roles = load_job_roles()
             if job_roles:
                 st.markdown("### 🎯 Select Target Role")
-                role, keywords = select_job_role(job_roles)
+                best_fit = dict(cached_role_recommendations(resume_hash, version, resume_text))
+                try:
+                    similar = cached_similar_roles(resume_hash, version, resume_text)
+                except Exception:
+                    similar = []
+                role, keywords = select_job_role(job_roles, best_fit, similar)
                 st.session_state["role"] = role
                 st.info(f"📌 Selected Role: **{role}**")
 
                 # keyword analysis
                 with st.expander("🔍 Keyword Analysis", expanded=True):
-                    result = analyze_keywords(resume_text, keywords)
+                    result = cached_keyword_analysis(resume_hash, role, version, resume_text, keywords)
                     st.session_state["result"] = result
                     display_keyword_analysis(result)
 
                 # feedback
                 with st.expander("💡 Feedback & Recommendations", expanded=True):
-                    found = result.get("found", [])
-                    missing = result.get("missing", [])
-                    feedback = generate_feedback(found, missing)
+                    feedback = generate_feedback(result.found, result.missing)
                     st.session_state["feedback"] = feedback
                     display_feedback(feedback)
                     show_summary(result)
@@ -83,7 +107,7 @@ with tab_resume:
                 # ats score
                 with st.expander("📊 ATS Score Simulation", expanded=True):
                     try:
-                        ats_score = calculate_ats_score(resume_text, role)
+                        ats_score = cached_ats_score(resume_hash, role, version, resume_text)
                         st.session_state["ats_score"] = ats_score
                         st.progress(int(ats_score))
                         st.metric(label="ATS Score", value=f"{ats_score}/100")
@@ -94,7 +118,7 @@ with tab_resume:
                 # nlp insights
                 with st.expander("🧠 NLP Insights", expanded=False):
                     try:
-                        top_keywords = extract_keywords(resume_text, top_n=40)
+                        top_keywords = insights["keywords"][:40]
                         if top_keywords:
                             st.write("**Top keywords (by frequency):**", ", ".join(top_keywords[:20]))
                         else:
@@ -104,9 +128,11 @@ with tab_resume:
 
                 # wordcloud
                 with st.expander("🌥️ WordCloud Visualization", expanded=False):
+                    # the low-resolution preview renders fast; the full-size image is only built on request
+                    full_size = st.toggle("Full-size word cloud", value=False)
                     wc_bytes = None
                     try:
-                        wc_bytes = generate_wordcloud_bytes(resume_text)
+                        wc_bytes = cached_wordcloud(resume_hash, resume_text, preview=not full_size)
                     except Exception:
                         wc_bytes = None
                     if wc_bytes:
@@ -117,7 +143,7 @@ with tab_resume:
                 # top 5 skills
                 with st.expander("💪 Top 5 Most Frequent Skills", expanded=False):
                     try:
-                        top_skills = get_top_skills(resume_text, top_n=5)
+                        top_skills = insights["top_skills"]
                         if top_skills:
                             st.write(", ".join([s.capitalize() for s in top_skills]))
                         else:
@@ -128,16 +154,11 @@ with tab_resume:
                 # skill frequency table and chart
                 with st.expander("📈 Skill Frequency Strength", expanded=False):
                     try:
-                        skill_df = get_skill_frequencies(resume_text)
-                        if not skill_df.empty:
-                            st.dataframe(skill_df, use_container_width=True)
-                            fig, ax = plt.subplots(figsize=(6, 4))
-                            ax.barh(skill_df["Skill"], skill_df["Count"])
-                            ax.invert_yaxis()
-                            ax.set_xlabel("Frequency")
-                            ax.set_ylabel("Skill")
-                            ax.set_title("Skill Strength in Resume")
-                            st.pyplot(fig)
+                        skill_counts = insights["skill_counts"]
+                        if skill_counts:
+                            st.dataframe(skill_frame(skill_counts), use_container_width=True)
+                            st.image(charts.skill_strength_chart([s.skill for s in skill_counts], [s.count for s in skill_counts]),
+                                     use_container_width=True)
                         else:
                             st.info("No technical skills detected for frequency analysis.")
                     except Exception as e:
@@ -146,7 +167,8 @@ with tab_resume:
                 # skill match %
                 with st.expander("🔗 Skill Match Percentage", expanded=True):
                     try:
-                        percent, matched_count, total_required, matched_list = calculate_skill_match_percentage(resume_text, keywords)
+                        skill_match = cached_skill_match(resume_hash, role, version, resume_text, keywords)
+                        percent, matched_count, total_required, matched_list = skill_match["match"]
                         st.metric(label="Match (%)", value=f"{percent}%")
                         st.progress(int(percent))
                         st.write(f"Matched {matched_count} out of {total_required} required keywords for **{role}**.")
@@ -158,17 +180,16 @@ with tab_resume:
 
                         # combined insights
                         from ui_helpers import display_resume_insights
-                        from nlp_analysis import calculate_skill_coverage
 
                         display_resume_insights(
                             match_percent=percent,
                             ats_score=st.session_state.get("ats_score", 0),
                             role=role,
-                            missing_keywords=result.get("missing", [])
+                            missing_keywords=result.missing
                         )
 
                         st.markdown("### 📋 Skill Coverage Summary")
-                        found_count, missing_count, coverage = calculate_skill_coverage(resume_text, keywords)
+                        found_count, missing_count, coverage = skill_match["coverage"]
                         st.write(f"- ✅ Found Skills: {found_count}")
                         st.write(f"- ❌ Missing Skills: {missing_count}")
                         st.write(f"- 📊 Coverage: {coverage}%")
@@ -195,7 +216,7 @@ with tab_portfolio:
 
     if username:
         with st.spinner("Fetching GitHub data..."):
-            data = analyze_github_profile(username)
+            data = cached_github_profile(username)
 
         if "error" in data:
             st.error(data["error"])
@@ -217,12 +238,14 @@ with tab_portfolio:
 
             try:
                 resume_text = st.session_state.get("resume_text", "")
+                resume_hash = st.session_state.get("resume_hash")
                 github_langs = data.get("top_languages", {})
 
                 if resume_text and github_langs:
                     langs_in_github = [lang.lower() for lang in github_langs.keys()]
 
-                    resume_keywords = extract_keywords(resume_text, top_n=50)
+                    insights = cached_nlp_insights(resume_hash, resume_text)
+                    resume_keywords = insights["keywords"]
                     resume_keywords = [k.lower() for k in resume_keywords]
 
                     matched = [lang for lang in langs_in_github if lang in resume_keywords]
@@ -248,19 +271,10 @@ with tab_portfolio:
                         # resume skill distribution (pie chart)
                         with col1:
                             st.markdown("#### Resume Skill Distribution")
-                            from nlp_analysis import get_skill_frequencies
-
-                            resume_skill_df = get_skill_frequencies(resume_text)
-                            if not resume_skill_df.empty:
-                                fig1, ax1 = plt.subplots()
-                                ax1.pie(
-                                    resume_skill_df["Count"],
-                                    labels=resume_skill_df["Skill"],
-                                    autopct="%1.1f%%",
-                                    startangle=90
-                                )
-                                ax1.axis("equal")
-                                st.pyplot(fig1)
+                            skill_counts = insights["skill_counts"]
+                            if skill_counts:
+                                st.image(charts.pie_chart([s.skill for s in skill_counts], [s.count for s in skill_counts]),
+                                         use_container_width=True)
                             else:
                                 st.info("No skills found in resume for visualization.")
 
@@ -268,15 +282,7 @@ with tab_portfolio:
                         with col2:
                             st.markdown("#### GitHub Language Distribution")
                             if github_langs:
-                                fig2, ax2 = plt.subplots()
-                                langs = list(github_langs.keys())
-                                lines = list(github_langs.values())
-                                ax2.bar(langs, lines)
-                                ax2.set_xlabel("Languages")
-                                ax2.set_ylabel("Lines of Code")
-                                ax2.set_title("GitHub Language Distribution")
-                                plt.xticks(rotation=45)
-                                st.pyplot(fig2)
+                                st.image(charts.language_bar_chart(github_langs.keys(), github_langs.values()), use_container_width=True)
                             else:
                                 st.info("No GitHub languages available for visualization.")
 
@@ -291,7 +297,7 @@ with tab_portfolio:
                     st.markdown("### 📊 GitHub Language vs Resume Focus")
                     try:
                         top_lang = max(github_langs, key=github_langs.get)
-                        resume_top_skills = get_top_skills(resume_text, top_n=1)
+                        resume_top_skills = insights["top_skills"][:1]
                         resume_focus = resume_top_skills[0] if resume_top_skills else "Unknown"
 
                         st.write(f"**🏆 Top GitHub Language:** {top_lang}")
@@ -313,13 +319,17 @@ with tab_portfolio:
             already_saved = st.session_state.get("last_saved_profile")
             if already_saved != data["username"]:
                 try:
+                    resume_hash = st.session_state.get("resume_hash")
+                    resume_text = st.session_state.get("resume_text")
                     save_analysis(
                         username=data["username"],
                         role=st.session_state.get("role", "N/A"),
                         ats_score=st.session_state.get("ats_score", 0),
                         repos=data["repositories"],
                         followers=data["followers"],
-                        contributions=data["contributions"]
+                        contributions=data["contributions"],
+                        resume_hash=resume_hash,
+                        resume_skills=resume_skill_bits(resume_text) if resume_hash and resume_text else None
                     )
                     st.session_state["last_saved_profile"] = data["username"]
                 except sqlite3.OperationalError as exc:
@@ -331,24 +341,35 @@ with tab_portfolio:
 
             # export pdf
             if st.button("📄 Export combined PDF report"):
-                with st.spinner("Generating PDF..."):
-                    try:
-                        from nlp_analysis import get_skill_frequencies
-
-                        resume_skill_df = get_skill_frequencies(st.session_state.get("resume_text", ""))
-                        filename = generate_pdf_report(
-                            role=st.session_state.get("role", "N/A"),
-                            result=st.session_state.get("result", {"found": [], "missing": []}),
-                            feedback=st.session_state.get("feedback", []),
-                            ats_score=st.session_state.get("ats_score", 0),
-                            portfolio_data=data,
-                            resume_skill_df=resume_skill_df)
+                try:
+                    from nlp_analysis import get_skill_frequencies
 
-                        st.success("✅ PDF report generated successfully!")
-                        with open(filename, "rb") as pdf_file:
-                            st.download_button("⬇️ Download Report", data=pdf_file, file_name=filename, mime="application/pdf")
-                    except Exception as e:
-                        st.error(f"Could not generate PDF: {e}")
+                    resume_skills = get_skill_frequencies(st.session_state.get("resume_text", ""))
+                    st.session_state["report_future"] = submit_pdf_report(
+                        role=st.session_state.get("role", "N/A"),
+                        result=st.session_state.get("result") or KeywordResult([], []),
+                        feedback=st.session_state.get("feedback", []),
+                        ats_score=st.session_state.get("ats_score", 0),
+                        portfolio_data=data,
+                        resume_skills=resume_skills)
+                    st.session_state["report_name"] = report_filename()
+                except Exception as e:
+                    st.error(f"Could not generate PDF: {e}")
+
+            report_future = st.session_state.get("report_future")
+            if report_future is not None:
+                # give a quick report the chance to finish in this run; slow ones keep rendering in the background
+                with st.spinner("Generating PDF..."):
+                    wait([report_future], timeout=REPORT_WAIT_SECONDS)
+                if not report_future.done():
+                    st.info("⏳ Your PDF report is still being generated.")
+                    st.button("🔄 Check report status")
+                elif report_future.exception() is not None:
+                    st.error(f"Could not generate PDF: {report_future.exception()}")
+                else:
+                    st.success("✅ PDF report generated successfully!")
+                    st.download_button("⬇️ Download Report", data=report_future.result(),
+                                       file_name=st.session_state.get("report_name"), mime="application/pdf")
 
 # progress history
 with tab_progress:
@@ -357,8 +378,26 @@ with tab_progress:
     username_for_history = st.text_input("History: Enter GitHub username to view progress", value="")
 
     if username_for_history:
+        col_since, col_until, col_size = st.columns(3)
+        since = col_since.date_input("From", value=None)
+        until = col_until.date_input("To", value=None)
+        page_size = col_size.selectbox("Rows per page", [25, 50, 100], index=1)
+
+        # keyset cursors of the pages visited so far; reset whenever the query changes
+        history_query = (username_for_history, since, until, page_size)
+        if st.session_state.get("history_query") != history_query:
+            st.session_state["history_query"] = history_query
+            st.session_state["history_cursors"] = [None]
+        cursors = st.session_state["history_cursors"]
+
+        next_cursor = None
         try:
-            history = get_user_history(username_for_history)
+            history, next_cursor = get_user_history_page(
+                username_for_history,
+                limit=page_size,
+                cursor=cursors[-1],
+                since=since,
+                until=until + timedelta(days=1) if until else None)
         except sqlite3.OperationalError as exc:
             st.error(f"Database error while fetching history: {exc}")
             history = []
@@ -367,6 +406,8 @@ with tab_progress:
             history = []
 
         if history:
+            import pandas as pd
+
             df = pd.DataFrame(history, columns=["Role", "ATS Score", "Repositories", "Followers", "Contributions", "Points", "Date"])
             st.dataframe(df)
             st.markdown("#### ATS Score Trend")
@@ -374,28 +415,26 @@ with tab_progress:
                 df["Date"] = pd.to_datetime(df["Date"])
             except Exception:
                 pass
-            fig, ax = plt.subplots(figsize=(6, 4))
-            ax.plot(df["Date"], df["ATS Score"], marker="o", linestyle="-", color="royalblue", linewidth=2)
-            ax.set_xlabel("Date")
-            ax.set_ylabel("ATS Score")
-            ax.set_title("ATS Score Over Time")
-            plt.xticks(rotation=45)
-            ax.grid(True, linestyle="--", alpha=0.5)
-            st.pyplot(fig)
-        else:
+            st.image(charts.ats_trend_chart(df["Date"], df["ATS Score"]), use_container_width=True)
+        elif len(cursors) == 1:
             st.info("No progress history yet — analyze a resume to start tracking your growth!")
 
+        col_newer, col_page, col_older = st.columns([1, 2, 1])
+        if len(cursors) > 1 and col_newer.button("◀ Newer"):
+            cursors.pop()
+            st.rerun()
+        col_page.caption(f"Page {len(cursors)}")
+        if next_cursor is not None and col_older.button("Older ▶"):
+            cursors.append(next_cursor)
+            st.rerun()
+
     # clear history
     st.markdown("---")
     st.subheader("🧹 Manage Your Data")
     if st.button("Clear My History"):
         if username_for_history:
             try:
-                conn = sqlite3.connect("analysis_history.db")
-                c = conn.cursor()
-                c.execute("DELETE FROM history WHERE username=?", (username_for_history,))
-                conn.commit()
-                conn.close()
+                clear_user_history(username_for_history)
                 st.success("✅ History cleared successfully!")
             except Exception as e:
                 st.error(f"Could not clear history: {e}")
@@ -411,8 +450,14 @@ with tab_leaderboard:
         st.error(f"Could not load leaderboard: {exc}")
         leaderboard = []
     if leaderboard:
+        import pandas as pd
+
         leaderboard_df = pd.DataFrame(leaderboard, columns=["Username", "Avg ATS Score", "Total Contributions", "Total Points"])
         leaderboard_df.index = leaderboard_df.index + 1
         st.dataframe(leaderboard_df)
     else:
-        st.info("No leaderboard data yet!")
\ No newline at end of file
+        st.info("No leaderboard data yet!")
+
+# performance breakdown, hidden unless RESUME_PERF_PANEL=1 or the URL has ?perf=1
+if os.getenv("RESUME_PERF_PANEL") == "1" or st.query_params.get("perf") == "1":
+    show_performance_panel(perf_run, perf_session)
@@ -0,0 +1,133 @@
+import hashlib
+import io
+import threading
+from functools import wraps
+import streamlit as st
+
+try:
+    from .resume_parser import extract_resume_text
+    from .keyword_analysis import KeywordResult, analyze_keywords
+    from .ats_score import calculate_ats_score, recommend_roles
+    from .role_ranker import rank_roles
+    from .job_registry import get_registry
+    from .nlp_analysis import extract_keywords, generate_wordcloud_bytes, get_top_skills, get_skill_frequencies, calculate_skill_match_percentage, calculate_skill_coverage
+    from .portfolio_analyzer import analyze_github_profile
+    from .perf import cache_event
+except ImportError:
+    from resume_parser import extract_resume_text
+    from keyword_analysis import KeywordResult, analyze_keywords
+    from ats_score import calculate_ats_score, recommend_roles
+    from role_ranker import rank_roles
+    from job_registry import get_registry
+    from nlp_analysis import extract_keywords, generate_wordcloud_bytes, get_top_skills, get_skill_frequencies, calculate_skill_match_percentage, calculate_skill_coverage
+    from portfolio_analyzer import analyze_github_profile
+    from perf import cache_event
+
+# Streamlit reruns the whole script on every widget change; these wrappers make an
+# unchanged (file hash, role, username) reuse the previous results. Arguments with a
+# leading underscore are not hashed by st.cache_data; they are fully determined by
+# the hashed key arguments.
+
+GITHUB_TTL_SECONDS = 600
+
+_calls = threading.local()
+
+def _cache_data(**options):
+    """st.cache_data that also reports each call to perf as a hit or a miss.
+
+    The miss is recorded inside the cached body, which only runs on a miss; the
+    lookup around it records a hit when the body didn't run.
+    """
+    def decorate(fn):
+        name = fn.__name__.lstrip("_")
+
+        @wraps(fn)
+        def body(*args, **kwargs):
+            _calls.missed = True
+            cache_event(name, False)
+            return fn(*args, **kwargs)
+
+        cached = st.cache_data(**options)(body)
+
+        @wraps(fn)
+        def lookup(*args, **kwargs):
+            outer = getattr(_calls, "missed", False)
+            _calls.missed = False
+            try:
+                result = cached(*args, **kwargs)
+                if not _calls.missed:
+                    cache_event(name, True)
+                return result
+            finally:
+                _calls.missed = outer
+
+        lookup.clear = cached.clear
+        return lookup
+    return decorate
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def jobs_version() -> str:
+    return get_registry().version
+
+@_cache_data(show_spinner=False, max_entries=32)
+def cached_resume_text(resume_hash: str, file_type: str, _data: bytes) -> str:
+    return extract_resume_text(io.BytesIO(_data), file_type)
+
+def load_uploaded_resume(uploaded_file):
+    """(content hash, extracted text) for a Streamlit upload."""
+    data = uploaded_file.getvalue()
+    file_type = uploaded_file.name.split(".")[-1].lower()
+    resume_hash = file_hash(data)
+    return resume_hash, cached_resume_text(resume_hash, file_type, data)
+
+@_cache_data(show_spinner=False, max_entries=256)
+def cached_keyword_analysis(resume_hash: str, role: str, version: str, _resume_text: str, _keywords) -> KeywordResult:
+    return analyze_keywords(_resume_text, _keywords)
+
+@_cache_data(show_spinner=False, max_entries=256)
+def cached_ats_score(resume_hash: str, role: str, version: str, _resume_text: str) -> float:
+    return calculate_ats_score(_resume_text, role)
+
+@_cache_data(show_spinner=False, max_entries=64)
+def cached_role_recommendations(resume_hash: str, version: str, _resume_text: str, top_k: int = 3) -> list:
+    return recommend_roles(_resume_text, top_k)
+
+@_cache_data(show_spinner=False, max_entries=64)
+def cached_similar_roles(resume_hash: str, version: str, _resume_text: str, top_k: int = 3) -> list:
+    return rank_roles(_resume_text, top_k)
+
+@_cache_data(show_spinner=False, max_entries=256)
+def cached_skill_match(resume_hash: str, role: str, version: str, _resume_text: str, _keywords) -> dict:
+    return {
+        "match": calculate_skill_match_percentage(_resume_text, _keywords),
+        "coverage": calculate_skill_coverage(_resume_text, _keywords)}
+
+@_cache_data(show_spinner=False, max_entries=32)
+def cached_nlp_insights(resume_hash: str, _resume_text: str) -> dict:
+    return {
+        "keywords": extract_keywords(_resume_text, top_n=50),
+        "top_skills": get_top_skills(_resume_text, top_n=5),
+        "skill_counts": get_skill_frequencies(_resume_text)}
+
+@_cache_data(show_spinner=False, max_entries=32)
+def cached_wordcloud(resume_hash: str, _resume_text: str, preview: bool = False):
+    return generate_wordcloud_bytes(_resume_text, preview=preview)
+
+class _UncachedResult(Exception):
+    pass
+
+@_cache_data(show_spinner=False, ttl=GITHUB_TTL_SECONDS, max_entries=128)
+def _github_profile(username: str) -> dict:
+    data = analyze_github_profile(username)
+    if "error" in data:
+        # raising keeps failures (typos, network errors) out of the cache
+        raise _UncachedResult(data)
+    return data
+
+def cached_github_profile(username: str) -> dict:
+    try:
+        return _github_profile(username)
+    except _UncachedResult as exc:
+        return exc.args[0]
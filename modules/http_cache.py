@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlencode
+
+try:
+    from .perf import cache_event
+except ImportError:
+    from perf import cache_event
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_PATH = os.getenv("GITHUB_CACHE_PATH", os.path.join(_PROJECT_DIR, ".cache", "github_http.sqlite"))
+MAX_CACHE_BYTES = int(os.getenv("GITHUB_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+class CachedResponse:
+    """The subset of `requests.Response` the analyzers use, backed by a cache entry."""
+
+    def __init__(self, status_code: int, content: bytes, from_cache: bool = False):
+        self.status_code = status_code
+        self.content = content
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+class HttpCache:
+    """SQLite-backed HTTP cache with ETag / Last-Modified revalidation.
+
+    Entries younger than the caller's TTL are served without a request. Older
+    ones are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged resource costs a 304 instead of a full download. Once the stored
+    bodies exceed `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_bytes: int = MAX_CACHE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    status INTEGER,
+                    body BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL,
+                    accessed_at REAL,
+                    size INTEGER
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+            # total body size kept current by triggers, so a store doesn't sum the table
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
+            conn.executescript("""
+                CREATE TRIGGER IF NOT EXISTS trg_responses_size_insert AFTER INSERT ON responses BEGIN
+                    UPDATE meta SET value = value + new.size WHERE key = 'total_size';
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_responses_size_delete AFTER DELETE ON responses BEGIN
+                    UPDATE meta SET value = value - old.size WHERE key = 'total_size';
+                END;
+                CREATE TRIGGER IF NOT EXISTS trg_responses_size_update AFTER UPDATE OF size ON responses BEGIN
+                    UPDATE meta SET value = value - old.size + new.size WHERE key = 'total_size';
+                END;
+            """)
+            conn.execute("""
+                INSERT OR IGNORE INTO meta (key, value)
+                SELECT 'total_size', COALESCE(SUM(size), 0) FROM responses
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _lookup(self, key):
+        with self._lock:
+            return self._connect().execute(
+                "SELECT status, body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+
+    def _touch(self, key, fetched_at=None):
+        with self._lock:
+            conn = self._connect()
+            if fetched_at is None:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            else:
+                conn.execute("UPDATE responses SET accessed_at = ?, fetched_at = ? WHERE key = ?",
+                             (time.time(), fetched_at, key))
+            conn.commit()
+
+    def _store(self, key, status, body, etag, last_modified):
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # an upsert rather than INSERT OR REPLACE: REPLACE's implicit delete doesn't fire the size trigger
+            conn.execute("""
+                INSERT INTO responses (key, status, body, etag, last_modified, fetched_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    status = excluded.status, body = excluded.body, etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at,
+                    accessed_at = excluded.accessed_at, size = excluded.size
+            """, (key, status, body, etag, last_modified, now, now, len(body)))
+            total = conn.execute("SELECT value FROM meta WHERE key = 'total_size'").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, size in conn.execute(
+                        "SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+                    if total <= self.max_bytes or old_key == key:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                    total -= size
+            conn.commit()
+
+    def get(self, session, url: str, ttl: float, params: Optional[dict] = None, timeout: float = 10):
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        entry = self._lookup(key)
+        if entry is not None and time.time() - entry[4] < ttl:
+            self._touch(key)
+            self._count("hits")
+            cache_event("github_http", True)
+            return CachedResponse(entry[0], entry[1], from_cache=True)
+
+        headers = {}
+        if entry is not None:
+            if entry[2]:
+                headers["If-None-Match"] = entry[2]
+            if entry[3]:
+                headers["If-Modified-Since"] = entry[3]
+
+        res = session.get(url, params=params, headers=headers, timeout=timeout)
+        if res.status_code == 304 and entry is not None:
+            self._touch(key, fetched_at=time.time())
+            self._count("revalidated")
+            cache_event("github_http", True)
+            return CachedResponse(entry[0], entry[1], from_cache=True)
+
+        self._count("misses")
+        cache_event("github_http", False)
+        if res.status_code == 200:
+            self._store(key, res.status_code, res.content, res.headers.get("ETag"), res.headers.get("Last-Modified"))
+        return CachedResponse(res.status_code, res.content)
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+_cache: Optional[HttpCache] = None
+
+def get_http_cache() -> HttpCache:
+    global _cache
+    if _cache is None:
+        _cache = HttpCache()
+    return _cache
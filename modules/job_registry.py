@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .skill_matcher import SkillMatcher, get_matcher, normalize_keyword, set_shared_vocabulary
+except ImportError:
+    from skill_matcher import SkillMatcher, get_matcher, normalize_keyword, set_shared_vocabulary
+
+DEFAULT_JOB_DATA = {
+    "Python Developer": ["Python", "Django", "Flask", "SQL", "APIs"],
+    "Java Developer": ["Java", "Spring Boot", "Hibernate", "Microservices", "SQL"],
+    "Data Scientist": ["Python", "Machine Learning", "Pandas", "Numpy", "SQL", "Deep Learning"],
+    "Full Stack Developer": ["JavaScript", "React", "Node.js", "MongoDB", "Express", "MERN"],
+    "Machine Learning Engineer": ["Python", "TensorFlow", "Scikit-learn", "Machine Learning", "Deep Learning"]
+}
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_CANDIDATES = [
+    os.path.join(_MODULE_DIR, "job_descriptions.json"),
+    os.path.join(_MODULE_DIR, "data", "job_descriptions.json"),
+    os.path.join(_MODULE_DIR, "data", "job_descriptions", "job_descriptions.json"),
+    os.path.join(os.path.dirname(_MODULE_DIR), "data", "job_descriptions", "job_descriptions.json"),
+    os.path.join(os.path.dirname(_MODULE_DIR), "job_descriptions.json"),]
+
+class JobRegistry:
+    """Job descriptions parsed once and re-read only when the file's mtime changes.
+
+    `roles` maps role -> keywords as written in the file, `index` maps
+    role -> normalized (lowercased) keywords, and `matcher` covers the union
+    of all role keywords. `skill_roles` inverts `index` (normalized keyword ->
+    roles listing it) and `role_order` gives each role's position in the file.
+    Treat the returned mappings as read-only.
+    """
+
+    def __init__(self, candidates: List[str], write_default: bool = True, shared: bool = False):
+        self._candidates = [os.path.normpath(p) for p in candidates]
+        self._write_default = write_default
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._mtime: Optional[float] = None
+        self._roles: Dict[str, List[str]] = {}
+        self._index: Dict[str, Tuple[str, ...]] = {}
+        self._skill_roles: Dict[str, Tuple[str, ...]] = {}
+        self._role_order: Dict[str, int] = {}
+        self._matcher: Optional[SkillMatcher] = None
+        self._version = ""
+
+    def _stat(self, path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _load(self):
+        error = None
+        for p in self._candidates:
+            mtime = self._stat(p)
+            if mtime is None:
+                continue
+            try:
+                with open(p, "rb") as f:
+                    raw = f.read()
+                data = json.loads(raw.decode("utf-8"))
+            except Exception as exc:
+                error = exc
+                continue
+            return p, mtime, data, raw
+
+        if not self._write_default:
+            if error is not None:
+                raise error
+            raise FileNotFoundError(f"Job descriptions file not found: {self._candidates[0]}")
+
+        target = self._candidates[0]
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(DEFAULT_JOB_DATA, f, indent=4)
+        return target, self._stat(target), DEFAULT_JOB_DATA, json.dumps(DEFAULT_JOB_DATA).encode("utf-8")
+
+    def refresh(self):
+        """Reload if the backing file changed (or vanished) since the last load."""
+        if self._path is not None and self._stat(self._path) == self._mtime:
+            return
+        with self._lock:
+            if self._path is not None and self._stat(self._path) == self._mtime:
+                return
+            path, mtime, data, raw = self._load()
+            index = {role: tuple(normalize_keyword(kw) for kw in keywords) for role, keywords in data.items()}
+            # a role listing a keyword twice appears twice, as calculate_ats_score counts it twice
+            skill_roles: Dict[str, List[str]] = {}
+            for role, keywords in index.items():
+                for kw in keywords:
+                    skill_roles.setdefault(kw, []).append(role)
+            self._matcher = get_matcher(kw for keywords in index.values() for kw in keywords)
+            if self._shared:
+                set_shared_vocabulary(self._matcher.keywords)
+            self._roles, self._index = data, index
+            self._skill_roles = {kw: tuple(roles) for kw, roles in skill_roles.items()}
+            self._role_order = {role: i for i, role in enumerate(index)}
+            self._version = hashlib.sha256(raw).hexdigest()[:16]
+            self._path, self._mtime = path, mtime
+
+    @property
+    def path(self) -> str:
+        self.refresh()
+        return self._path
+
+    @property
+    def roles(self) -> Dict[str, List[str]]:
+        self.refresh()
+        return self._roles
+
+    @property
+    def index(self) -> Dict[str, Tuple[str, ...]]:
+        self.refresh()
+        return self._index
+
+    @property
+    def skill_roles(self) -> Dict[str, Tuple[str, ...]]:
+        self.refresh()
+        return self._skill_roles
+
+    @property
+    def role_order(self) -> Dict[str, int]:
+        self.refresh()
+        return self._role_order
+
+    @property
+    def matcher(self) -> SkillMatcher:
+        self.refresh()
+        return self._matcher
+
+    @property
+    def version(self) -> str:
+        """Short content hash of the loaded job descriptions."""
+        self.refresh()
+        return self._version
+
+_registries: Dict[Optional[str], JobRegistry] = {}
+_registries_lock = threading.Lock()
+
+def get_registry(path: Optional[str] = None) -> JobRegistry:
+    """Process-wide registry for `path`, or for the default job_descriptions.json lookup."""
+    key = os.path.normpath(path) if path else None
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(key)
+            if registry is None:
+                if key is None:
+                    registry = JobRegistry(DEFAULT_CANDIDATES, shared=True)
+                else:
+                    registry = JobRegistry([key], write_default=False)
+                _registries[key] = registry
+    return registry
+
+@contextmanager
+def use_registry(registry: JobRegistry) -> Iterator[JobRegistry]:
+    """Make `registry` the default (`get_registry()`) one until the block exits."""
+    with _registries_lock:
+        original = _registries.get(None)
+        _registries[None] = registry
+    try:
+        yield registry
+    finally:
+        with _registries_lock:
+            if original is not None:
+                _registries[None] = original
+            else:
+                _registries.pop(None, None)
+        if original is not None:
+            set_shared_vocabulary(original.matcher.keywords)
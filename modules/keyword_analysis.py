@@ -1,18 +1,30 @@
-def analyze_keywords(resume_text, keywords):
+from typing import List, NamedTuple
+
+try:
+    from .perf import traced
+    from .skill_matcher import match_keywords, normalize_keyword
+except ImportError:
+    from perf import traced
+    from skill_matcher import match_keywords, normalize_keyword
+
+class KeywordResult(NamedTuple):
+    found: List[str]
+    missing: List[str]
+
+@traced
+def analyze_keywords(resume_text, keywords) -> KeywordResult:
     """
     Check which keywords are present and which are missing in the resume text.
     """
     found = []
     missing = []
 
-    text_lower = resume_text.lower()
+    hits = match_keywords(resume_text, keywords)
 
     for kw in keywords:
-        if kw.lower() in text_lower:
+        if normalize_keyword(kw) in hits:
             found.append(kw)
         else:
             missing.append(kw)
 
-    return {
-        "found": found,
-        "missing": missing}
\ No newline at end of file
+    return KeywordResult(found, missing)
\ No newline at end of file
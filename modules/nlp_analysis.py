@@ -1,120 +1,194 @@
-from typing import List
-from collections import Counter
+from typing import List, NamedTuple, Tuple
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+import hashlib
 import re
 import io
-import pandas as pd
+import threading
 
-_STOPWORDS = {"and", "the", "for", "with", "from", "that", "this", "you", "are", "was", "have",
+try:
+    from .perf import cache_event, traced
+    from .skill_matcher import match_keywords, normalize_keyword
+except ImportError:
+    from perf import cache_event, traced
+    from skill_matcher import match_keywords, normalize_keyword
+
+# fixed vocabularies, built once at import
+_STOPWORDS = frozenset({"and", "the", "for", "with", "from", "that", "this", "you", "are", "was", "have",
     "has", "will", "not", "your", "but", "our", "they", "their", "them", "about", "which",
     "when", "what", "where", "why", "how", "all", "any", "also", "use", "used", "using", "one",
-    "can", "may", "should", "a", "an", "in", "on", "of", "to"}
+    "can", "may", "should", "a", "an", "in", "on", "of", "to"})
+
+_TECHNICAL_SKILLS = frozenset({"python", "java", "c++", "sql", "pandas", "numpy", "matplotlib",
+    "tensorflow", "scikit-learn", "machine", "learning", "deep", "django",
+    "flask", "react", "aws", "docker", "html", "css", "javascript"})
+
+class SkillCount(NamedTuple):
+    skill: str
+    count: int
 
-def __simple_tokenize(text: str) -> List[str]:
+def _simple_tokenize(text: str) -> List[str]:
     return re.findall(r"[A-Za-z0-9\-\+#]+", text)
 
-def extract_keywords(text: str, top_n: int = 30) -> List[str]:
-    if not text:
-        return []
-    tokens = [t.lower() for t in __simple_tokenize(text)]
-    filtered = [t for t in tokens if len(t) > 2 and t not in _STOPWORDS]
-    counts = Counter(filtered)
-    return [tok for tok, _ in counts.most_common(top_n)]
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, as every NLP feature here sees the text."""
+    return [t.lower() for t in _simple_tokenize(text or "")]
 
-def get_top_skills(text: str, top_n: int = 5) -> List[str]:
-    TECHNICAL_SKILLS = {"python", "java", "c++", "sql", "pandas", "numpy", "matplotlib",
-        "tensorflow", "scikit-learn", "machine", "learning", "deep", "django",
-        "flask", "react", "aws", "docker", "html", "css", "javascript"}
+class ResumeDocument:
+    """Resume text tokenized once; every NLP result is derived lazily from the same counts."""
 
-    tokens = [t.lower() for t in __simple_tokenize(text)]
-    filtered = [
-        t for t in tokens
-        if len(t) > 2 and t not in _STOPWORDS and not t.isdigit() and t in TECHNICAL_SKILLS]
+    def __init__(self, text: str):
+        self.text = text or ""
 
-    counts = Counter(filtered)
-    return [tok for tok, _ in counts.most_common(top_n)]
+    @cached_property
+    def tokens(self) -> List[str]:
+        return tokenize(self.text)
 
-def get_skill_frequencies(text: str):
-    if not text:
-        return pd.DataFrame(columns=["Skill", "Count"])
+    @cached_property
+    def keyword_counts(self) -> Counter:
+        return Counter(t for t in self.tokens if len(t) > 2 and t not in _STOPWORDS)
 
-    TECHNICAL_SKILLS = {"python", "java", "c++", "sql", "pandas", "numpy", "matplotlib",
-        "tensorflow", "scikit-learn", "machine", "learning", "deep", "django",
-        "flask", "react", "aws", "docker", "html", "css", "javascript"}
+    @cached_property
+    def skill_counts(self) -> Counter:
+        # every skill is longer than two chars and not a stopword, so keyword_counts already holds
+        # them, in first-occurrence order
+        return Counter({t: c for t, c in self.keyword_counts.items() if t in _TECHNICAL_SKILLS})
 
-    tokens = [t.lower() for t in __simple_tokenize(text)]
-    filtered = [t for t in tokens if t in TECHNICAL_SKILLS]
-    if not filtered:
-        return pd.DataFrame(columns=["Skill", "Count"])
+    def keywords(self, top_n: int = 30) -> List[str]:
+        return [tok for tok, _ in self.keyword_counts.most_common(top_n)]
 
-    counts = Counter(filtered)
-    df = pd.DataFrame(counts.items(), columns=["Skill", "Count"]).sort_values(by="Count", ascending=False)
-    return df.reset_index(drop=True)
+    def top_skills(self, top_n: int = 5) -> List[str]:
+        return [tok for tok, _ in self.skill_counts.most_common(top_n)]
 
-def calculate_skill_match_percentage(text: str, required_skills: List[str]):
-    if not required_skills:
-        return 0, 0, 0, []
+    @cached_property
+    def skill_frequencies(self) -> Tuple[SkillCount, ...]:
+        # most frequent first; ties keep first-occurrence order
+        return tuple(SkillCount(skill, count) for skill, count in self.skill_counts.most_common())
+
+@lru_cache(maxsize=16)
+def get_document(text: str) -> ResumeDocument:
+    """Shared ResumeDocument for `text`, so repeated calls during one render tokenize once."""
+    return ResumeDocument(text)
 
-    text_lower = text.lower()
-    matched = []
+@traced
+def extract_keywords(text: str, top_n: int = 30) -> List[str]:
+    if not text:
+        return []
+    return get_document(text).keywords(top_n)
 
-    for skill in required_skills:
-        if not skill or not isinstance(skill, str):
-            continue
-        skill_norm = skill.strip().lower()
+@traced
+def get_top_skills(text: str, top_n: int = 5) -> List[str]:
+    return get_document(text).top_skills(top_n)
 
-        try:
-            pattern = r"\b" + re.escape(skill_norm) + r"\b"
-            if re.search(pattern, text_lower):
-                matched.append(skill)
-                continue
-        except re.error:
-            pass
+@traced
+def get_skill_frequencies(text: str) -> Tuple[SkillCount, ...]:
+    """Technical skills mentioned in the resume with their counts, most frequent first."""
+    if not text:
+        return ()
+    return get_document(text).skill_frequencies
 
-        if skill_norm in text_lower:
-            matched.append(skill)
+@traced
+def calculate_skill_match_percentage(text: str, required_skills: List[str]):
+    if not required_skills:
+        return 0, 0, 0, []
+
+    valid = [skill for skill in required_skills if skill and isinstance(skill, str)]
+    hits = match_keywords(text, [skill.strip() for skill in valid])
+    matched = [skill for skill in valid if normalize_keyword(skill.strip()) in hits]
 
     total = len(required_skills)
     matched_count = len(matched)
     percent = int(round((matched_count / total) * 100)) if total > 0 else 0
     return percent, matched_count, total, matched
 
-def generate_wordcloud_bytes(text: str, max_words: int = 150) -> bytes:
-    if not text:
-        return None
+WORDCLOUD_SIZE = (900, 400)
+WORDCLOUD_PREVIEW_SIZE = (450, 200)
+MAX_CACHED_WORDCLOUDS = 32
 
-    try:
+class _WordCloudRenderer:
+    """Reuses one configured WordCloud per (size, max_words) and memoizes rendered PNGs in a bounded LRU.
+
+    `_lock` only guards the two dicts, so cache hits never wait on a render. A
+    WordCloud keeps layout state between generate() calls, so each instance
+    has its own lock and renders of different sizes run concurrently.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_WORDCLOUDS):
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+        self._instances = {}
+        self._pngs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _instance(self, size, max_words):
         from wordcloud import WordCloud
-    except Exception:
+
+        key = (size, max_words)
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is None:
+                wc = WordCloud(
+                    width=size[0],
+                    height=size[1],
+                    background_color="white",
+                    collocations=False,
+                    max_words=max_words
+                )
+                entry = self._instances[key] = (wc, threading.Lock())
+        return entry
+
+    def render(self, cloud_text: str, max_words: int, preview: bool) -> bytes:
+        size = WORDCLOUD_PREVIEW_SIZE if preview else WORDCLOUD_SIZE
+        key = hashlib.sha256(f"{size}|{max_words}|{cloud_text}".encode("utf-8")).hexdigest()
+        with self._lock:
+            png = self._pngs.get(key)
+            if png is not None:
+                self._pngs.move_to_end(key)
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+        cache_event("wordcloud", png is not None)
+        if png is not None:
+            return png
+
+        wc, wc_lock = self._instance(size, max_words)
+        with wc_lock:
+            img = wc.generate(cloud_text).to_image()
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        png = buf.getvalue()
+
+        with self._lock:
+            self._pngs[key] = png
+            self._pngs.move_to_end(key)
+            while len(self._pngs) > self.max_entries:
+                self._pngs.popitem(last=False)
+        return png
+
+_wordcloud_renderer = _WordCloudRenderer()
+
+@traced
+def generate_wordcloud_bytes(text: str, max_words: int = 150, preview: bool = False) -> bytes:
+    """PNG word cloud of the resume's top keywords; `preview` renders a quick low-resolution version."""
+    if not text:
         return None
 
     try:
         keywords = extract_keywords(text, top_n=max_words)
         cloud_text = " ".join(keywords) if keywords else text
-
-        wc = WordCloud(
-            width=900,
-            height=400,
-            background_color="white",
-            collocations=False,
-            max_words=max_words
-        ).generate(cloud_text)
-
-        img = wc.to_image()
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        buf.seek(0)
-        return buf.getvalue()
+        return _wordcloud_renderer.render(cloud_text, max_words, preview)
     except Exception:
         return None
 
 # skill coverage
+@traced
 def calculate_skill_coverage(text: str, required_skills: List[str]):
     if not text or not required_skills:
         return 0, 0, 0
 
-    text_lower = text.lower()
-    found = [s for s in required_skills if s.lower() in text_lower]
-    missing = [s for s in required_skills if s.lower() not in text_lower]
+    hits = match_keywords(text, required_skills)
+    found = [s for s in required_skills if normalize_keyword(s) in hits]
+    missing = [s for s in required_skills if normalize_keyword(s) not in hits]
 
     found_count = len(found)
     missing_count = len(missing)
@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+# Lightweight stage tracing. A traced call adds its wall time to the recorder of the
+# current run (one dashboard rerun) and to the process-wide `totals`; caches report
+# hits and misses the same way. Stage times include any traced stages nested inside,
+# and calls made concurrently on worker threads are summed.
+
+ENABLED = os.getenv("RESUME_PERF", "1") != "0"
+PROMETHEUS_PREFIX = "resume_analyzer"
+
+class Recorder:
+    """Wall time, call counts and cache hits collected over one unit of work.
+
+    Events are also forwarded to `parent` as they happen, so an enclosing
+    recorder (e.g. a whole session) stays current even if the run is cut short.
+    """
+
+    def __init__(self, parent: Optional["Recorder"] = None):
+        self.parent = parent
+        self.started = time.time()
+        self.stages: Dict[str, dict] = {}
+        self.caches: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def add_stage(self, name: str, seconds: float, failed: bool = False):
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            stage["calls"] += 1
+            stage["errors"] += int(failed)
+            stage["total_seconds"] += seconds
+            stage["max_seconds"] = max(stage["max_seconds"], seconds)
+        if self.parent is not None:
+            self.parent.add_stage(name, seconds, failed)
+
+    def add_cache(self, name: str, hit: bool):
+        with self._lock:
+            cache = self.caches.setdefault(name, {"hits": 0, "misses": 0})
+            cache["hits" if hit else "misses"] += 1
+        if self.parent is not None:
+            self.parent.add_cache(name, hit)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started": self.started,
+                "stages": {name: dict(stage) for name, stage in self.stages.items()},
+                "caches": {name: dict(cache) for name, cache in self.caches.items()}}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Counters in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        metrics = [
+            ("stage_calls_total", "counter", "Calls per stage.", "stages", "stage", "calls"),
+            ("stage_errors_total", "counter", "Calls per stage that raised.", "stages", "stage", "errors"),
+            ("stage_seconds_total", "counter", "Wall time spent per stage.", "stages", "stage", "total_seconds"),
+            ("stage_max_seconds", "gauge", "Slowest single call per stage.", "stages", "stage", "max_seconds"),
+            ("cache_hits_total", "counter", "Cache hits per cache.", "caches", "cache", "hits"),
+            ("cache_misses_total", "counter", "Cache misses per cache.", "caches", "cache", "misses"),
+        ]
+        lines = []
+        for metric, kind, help_text, section, label, field in metrics:
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, values in sorted(snapshot[section].items()):
+                lines.append(f'{name}{{{label}="{_escape_label(key)}"}} {values[field]}')
+        return "\n".join(lines) + "\n"
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+totals = Recorder()
+_local = threading.local()
+
+def current() -> Optional[Recorder]:
+    """Recorder of the run active on this thread, if any."""
+    return getattr(_local, "recorder", None)
+
+def start_run(parent: Optional[Recorder] = None) -> Recorder:
+    """Start collecting a new run on this thread (e.g. at the top of a dashboard rerun), also feeding `parent`."""
+    _local.recorder = Recorder(parent)
+    return _local.recorder
+
+@contextmanager
+def use(recorder: Optional[Recorder]):
+    previous = current()
+    _local.recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _local.recorder = previous
+
+def bind(fn: Callable) -> Callable:
+    """Wrap `fn` so it records into the caller's run when executed on a worker thread."""
+    recorder = current()
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with use(recorder):
+            return fn(*args, **kwargs)
+    return wrapper
+
+def _record(name: str, seconds: float, failed: bool):
+    totals.add_stage(name, seconds, failed)
+    recorder = current()
+    if recorder is not None:
+        recorder.add_stage(name, seconds, failed)
+
+def cache_event(name: str, hit: bool):
+    if not ENABLED:
+        return
+    totals.add_cache(name, hit)
+    recorder = current()
+    if recorder is not None:
+        recorder.add_cache(name, hit)
+
+@contextmanager
+def trace(name: str):
+    """Time the enclosed block as stage `name`."""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record(name, time.perf_counter() - start, failed)
+
+def traced(fn: Callable = None, *, name: str = None):
+    """Decorator form of `trace`; the stage defaults to "<module>.<function>"."""
+    def decorate(func):
+        stage = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            failed = False
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                _record(stage, time.perf_counter() - start, failed)
+        return wrapper
+
+    return decorate(fn) if fn is not None else decorate
@@ -1,8 +1,17 @@
-import requests
 import re
+import threading
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 import os
 
+try:
+    from .http_cache import get_http_cache
+    from .perf import bind, traced
+except ImportError:
+    from http_cache import get_http_cache
+    from perf import bind, traced
+
 HEADERS = {"User-Agent": "Mozilla/5.0"}
 
 # github token support to prevent rate limits
@@ -10,46 +19,123 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
 
+# overridable so the dashboard can be pointed at a GitHub Enterprise host or a local stub
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+GITHUB_WEB_URL = os.getenv("GITHUB_WEB_URL", "https://github.com").rstrip("/")
+
+MAX_CONCURRENT_REQUESTS = 8
+LANGUAGES_DEADLINE_SECONDS = 15.0
+
+# how long a cached response is served before it is revalidated (ETag / Last-Modified)
+PROFILE_TTL_SECONDS = 10 * 60
+REPOS_TTL_SECONDS = 30 * 60
+LANGUAGES_TTL_SECONDS = 24 * 60 * 60
+CONTRIBUTIONS_TTL_SECONDS = 60 * 60
+
+_session = None
+_session_lock = threading.Lock()
+
 def _safe_int(s):
     try:
         return int(str(s).replace(",", "").strip())
     except Exception:
         return 0
 
-def fetch_top_languages(username: str, max_repos: int = 10):
-    try:
-        repos_url = f"https://api.github.com/users/{username}/repos"
-        res = requests.get(repos_url, headers=HEADERS, timeout=10)
+def _get_session():
+    """Shared keep-alive session; its pool is sized for the concurrent language fetches."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(HEADERS)
+                _session = session
+    return _session
+
+@traced(name="portfolio_analyzer.http_get")
+def _cached_get(url, ttl, params=None, timeout=10):
+    return get_http_cache().get(_get_session(), url, ttl, params=params, timeout=timeout)
+
+def _fetch_repo_languages(lang_url):
+    lang_res = _cached_get(lang_url, LANGUAGES_TTL_SECONDS, timeout=5)
+    if lang_res.status_code == 200:
+        return lang_res.json()
+    return {}
+
+def _fetch_repos(username, max_repos):
+    repos = []
+    per_page = max(1, min(100, max_repos))
+    page = 1
+    while len(repos) < max_repos:
+        res = _cached_get(f"{GITHUB_API_URL}/users/{username}/repos", REPOS_TTL_SECONDS,
+                          params={"per_page": per_page, "page": page}, timeout=10)
         if res.status_code != 200:
+            return repos if repos else None
+        batch = res.json()
+        repos.extend(batch)
+        if len(batch) < per_page:
+            break
+        page += 1
+    return repos[:max_repos]
+
+@traced
+def fetch_top_languages(username: str, max_repos: int = 10, max_workers: int = MAX_CONCURRENT_REQUESTS,
+                        deadline: float = LANGUAGES_DEADLINE_SECONDS):
+    """Sum language bytes over up to `max_repos` repos, fetching them concurrently.
+
+    Requests that have not finished `deadline` seconds after the start are
+    dropped, so the call is bounded by the deadline rather than the repo count.
+    """
+    started = time.monotonic()
+    try:
+        repos = _fetch_repos(username, max_repos)
+        if repos is None:
             return {}
 
-        repos = res.json()
-        language_counts = Counter()
+        lang_urls = [repo.get("languages_url") for repo in repos]
+        lang_urls = [url for url in lang_urls if url]
+        if not lang_urls:
+            return {}
+
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(lang_urls))))
+        try:
+            fetch = bind(_fetch_repo_languages)
+            futures = [pool.submit(fetch, url) for url in lang_urls]
+            wait(futures, timeout=max(0.0, deadline - (time.monotonic() - started)))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-        for repo in repos[:max_repos]:
-            lang_url = repo.get("languages_url")
-            if not lang_url:
+        # aggregate in repo order so ties in most_common() stay deterministic
+        language_counts = Counter()
+        for future in futures:
+            if not future.done() or future.cancelled() or future.exception() is not None:
                 continue
-            lang_res = requests.get(lang_url, headers=HEADERS, timeout=5)
-            if lang_res.status_code == 200:
-                langs = lang_res.json()
-                for lang, count in langs.items():
-                    language_counts[lang] += count
+            for lang, count in future.result().items():
+                language_counts[lang] += count
 
         return dict(language_counts.most_common(5))
 
     except Exception:
         return {}
 
+@traced
 def analyze_github_profile(username: str):
+    import requests
+
     if not username or not str(username).strip():
         return {"error": "GitHub username cannot be empty."}
 
-    api_url = f"https://api.github.com/users/{username}"
-    contrib_url = f"https://github.com/users/{username}/contributions"
+    api_url = f"{GITHUB_API_URL}/users/{username}"
+    contrib_url = f"{GITHUB_WEB_URL}/users/{username}/contributions"
 
     try:
-        res = requests.get(api_url, headers=HEADERS, timeout=8)
+        res = _cached_get(api_url, PROFILE_TTL_SECONDS, timeout=8)
         if res.status_code != 200:
             return {"error": f"Profile not found: {username}"}
         data = res.json()
@@ -58,7 +144,7 @@ def analyze_github_profile(username: str):
 
         contributions = 0
         try:
-            html = requests.get(contrib_url, headers=HEADERS, timeout=8).text
+            html = _cached_get(contrib_url, CONTRIBUTIONS_TTL_SECONDS, timeout=8).text
             m = re.search(r'([0-9][0-9,]*)\s+contributions\s+in\s+the\s+last\s+year', html, re.I)
             if m:
                 contributions = _safe_int(m.group(1))
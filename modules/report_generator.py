@@ -1,19 +1,37 @@
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, HRFlowable, ListFlowable, ListItem, Image, Table, TableStyle)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import os
-import matplotlib.pyplot as plt
+import io
 
-def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None, resume_skill_df=None):
-    out_dir = os.path.abspath(os.path.dirname(__file__))
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"resume_portfolio_report_{timestamp}.pdf"
-    filepath = os.path.join(out_dir, filename)
+try:
+    from . import charts
+    from .perf import bind, traced
+except ImportError:
+    import charts
+    from perf import bind, traced
+
+# reports are built off the Streamlit script thread; everything below works on in-memory
+# buffers and charts renders on standalone Figures, so concurrent reports don't share state
+_report_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-report")
+
+def report_filename() -> str:
+    return f"resume_portfolio_report_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.pdf"
+
+def submit_pdf_report(*args, **kwargs) -> Future:
+    """Queue `generate_pdf_report` on the background pool; the future resolves to the PDF bytes."""
+    return _report_pool.submit(bind(generate_pdf_report), *args, **kwargs)
+
+@traced
+def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None, resume_skills=None) -> bytes:
+    # reportlab is only loaded once a report is actually requested
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, HRFlowable, ListFlowable, ListItem, Image, Table, TableStyle)
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+
+    pdf_buffer = io.BytesIO()
 
     doc = SimpleDocTemplate(
-        filepath,
+        pdf_buffer,
         pagesize=A4,
         leftMargin=40,
         rightMargin=40,
@@ -68,8 +86,8 @@ def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None,
 
     # keyword analysis
     content.append(Paragraph("Keyword Analysis", section_style))
-    found = result.get("found", []) if isinstance(result, dict) else []
-    missing = result.get("missing", []) if isinstance(result, dict) else []
+    found = result.found if result is not None else []
+    missing = result.missing if result is not None else []
     content.append(Paragraph(f"<b>Found Keywords:</b> {', '.join(found) if found else 'None'}", normal))
     content.append(Paragraph(f"<b>Missing Keywords:</b> {', '.join(missing) if missing else 'None'}", normal))
     content.append(Spacer(1, 8))
@@ -108,11 +126,11 @@ def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None,
         contributions = portfolio_data.get("contributions", "N/A")
         github_langs = portfolio_data.get("top_languages", {})
 
-        if resume_skill_df is not None and not resume_skill_df.empty and github_langs:
-            resume_skills_lower = set(resume_skill_df["Skill"].str.lower())
+        if resume_skills and github_langs:
+            resume_skills_lower = {s.skill.lower() for s in resume_skills}
             github_skills_lower = set(map(str.lower, github_langs.keys()))
             common_skills = resume_skills_lower & github_skills_lower
-            overlap_percent = round((len(common_skills) / max(1, len(resume_skill_df))) * 100, 1)
+            overlap_percent = round((len(common_skills) / max(1, len(resume_skills))) * 100, 1)
             shared_skills = ", ".join(sorted(common_skills)) if common_skills else "None"
             total_combined = len(resume_skills_lower | github_skills_lower)
 
@@ -157,44 +175,21 @@ def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None,
 
             # charts
             try:
-                pie_path = os.path.join(out_dir, f"resume_pie_{timestamp}.png")
-                plt.figure(figsize=(3.2, 3.2))
-                plt.pie(
-                    resume_skill_df["Count"],
-                    labels=resume_skill_df["Skill"],
-                    autopct="%1.1f%%",
-                    startangle=90
-                )
-                plt.title("Resume Skill Distribution", fontsize=10)
-                plt.tight_layout()
-                plt.savefig(pie_path, dpi=150)
-                plt.close()
+                pie_png = io.BytesIO(charts.pie_chart(
+                    [s.skill for s in resume_skills], [s.count for s in resume_skills], title="Resume Skill Distribution",
+                    figsize=(3.2, 3.2), dpi=150, title_size=10))
             except Exception:
-                pie_path = None
+                pie_png = None
 
             try:
-                bar_path = os.path.join(out_dir, f"github_bar_{timestamp}.png")
-                plt.figure(figsize=(3.2, 3.2))
-                langs = list(github_langs.keys())
-                lines = list(github_langs.values())
-                plt.bar(langs, lines)
-                plt.xlabel("Languages", fontsize=9)
-                plt.ylabel("Lines of Code", fontsize=9)
-                plt.title("GitHub Language Distribution", fontsize=10)
-                plt.xticks(rotation=45, fontsize=8)
-
-                plt.ticklabel_format(style='plain', axis='y')
-
-                plt.tight_layout()
-                plt.savefig(bar_path, dpi=150)
-                plt.close()
-
+                bar_png = io.BytesIO(charts.language_bar_chart(
+                    github_langs.keys(), github_langs.values(), figsize=(3.2, 3.2), dpi=150, font_size=9, plain_y=True))
             except Exception:
-                bar_path = None
+                bar_png = None
 
             content.append(Paragraph("Combined Skill Visualization", section_style))
-            img_left = Image(pie_path, width=200, height=180) if pie_path else Paragraph("No resume chart", normal)
-            img_right = Image(bar_path, width=200, height=180) if bar_path else Paragraph("No GitHub chart", normal)
+            img_left = Image(pie_png, width=200, height=180) if pie_png else Paragraph("No resume chart", normal)
+            img_right = Image(bar_png, width=200, height=180) if bar_png else Paragraph("No GitHub chart", normal)
             charts_table = Table([[img_left, img_right]], colWidths=[270, 270], hAlign="CENTER")
             charts_table.setStyle(TableStyle([("VALIGN", (0, 0), (-1, -1), "MIDDLE")]))
             content.append(charts_table)
@@ -213,4 +208,4 @@ def generate_pdf_report(role, result, feedback, ats_score, portfolio_data=None,
     content.append(Spacer(1, 6))
     content.append(Paragraph("Generated by Resume & Portfolio Analyzer", footer))
     doc.build(content)
-    return filepath
\ No newline at end of file
+    return pdf_buffer.getvalue()
\ No newline at end of file
@@ -1,20 +1,135 @@
-import pdfplumber
-import docx
-
-def extract_text_from_pdf(file):
-    text = []
-    with pdfplumber.open(file) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text(x_tolerance=2, y_tolerance=2)
-            if page_text:
-                text.append(page_text)
-    return clean_text("\n".join(text))
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 
+try:
+    from .perf import traced
+    from .text_cache import content_hash, get_text_cache
+except ImportError:
+    from perf import traced
+    from text_cache import content_hash, get_text_cache
+
+# bump whenever extraction or clean_text changes, so cached text is not reused
+PARSER_VERSION = "1"
+
+# pdfplumber and python-docx are imported by the functions that use them, so a DOCX
+# upload never loads pdfplumber and importing this module stays cheap
+
+def _page_text(page):
+    return page.extract_text(x_tolerance=2, y_tolerance=2)
+
+def _extract_page_range(source, start, stop):
+    import pdfplumber
+
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with pdfplumber.open(source) as pdf:
+        return [_page_text(page) for page in pdf.pages[start:stop]]
+
+def _read_source(file):
+    """Path as-is, or the bytes of a file-like object (so worker processes can reopen it)."""
+    if isinstance(file, (str, os.PathLike)):
+        return os.fspath(file)
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    if hasattr(file, "seek"):
+        file.seek(0)
+    return file.read()
+
+def iter_pdf_pages(file, max_pages=None, workers=None, chunk_size=None):
+    """Yield the text of each non-empty page in order, as soon as it is extracted.
+
+    With `workers` > 1, the pages are split into ranges of `chunk_size` (by default
+    one range per worker, since each range re-opens the PDF) that are extracted
+    concurrently in worker processes; pages are still yielded in document order.
+    """
+    import pdfplumber
+
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be at least 1")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if not workers or workers <= 1:
+        with pdfplumber.open(file) as pdf:
+            for page in pdf.pages[:max_pages]:
+                page_text = _page_text(page)
+                if page_text:
+                    yield page_text
+        return
+
+    source = _read_source(file)
+    with pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source) as pdf:
+        page_count = len(pdf.pages)
+    if max_pages is not None:
+        page_count = min(page_count, max_pages)
+    if not page_count:
+        return
+    chunk_size = chunk_size or math.ceil(page_count / workers)
+    starts = list(range(0, page_count, chunk_size))
+
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)))
+    try:
+        chunks = pool.map(_extract_page_range, [source] * len(starts), starts,
+                          [min(s + chunk_size, page_count) for s in starts])
+        for chunk in chunks:
+            for page_text in chunk:
+                if page_text:
+                    yield page_text
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+@traced
+def extract_text_from_pdf(file, max_pages=None, workers=None):
+    return clean_text("\n".join(iter_pdf_pages(file, max_pages=max_pages, workers=workers)))
+
+@traced
 def extract_text_from_docx(file):
+    import docx
+
     doc = docx.Document(file)
     text = "\n".join([para.text for para in doc.paragraphs])
     return clean_text(text)
 
+def _text_key(resume_hash, file_type):
+    return f"{resume_hash}-{file_type}-v{PARSER_VERSION}"
+
+def lookup_cached_text(resume_hash):
+    """Previously extracted text for a file's content hash, or None if it is not in the text cache."""
+    cache = get_text_cache()
+    for file_type in ("pdf", "docx"):
+        text = cache.get(_text_key(resume_hash, file_type))
+        if text is not None:
+            return text
+    return None
+
+@traced
+def extract_resume_text(file, file_type=None):
+    """Extract cleaned text from a PDF/DOCX path or upload, reusing cached text for identical bytes."""
+    if isinstance(file, (str, os.PathLike)):
+        name = os.fspath(file)
+        with open(name, "rb") as f:
+            data = f.read()
+    else:
+        name = getattr(file, "name", "")
+        data = _read_source(file)
+
+    file_type = (file_type or os.path.splitext(name)[1].lstrip(".")).lower()
+    if file_type not in ("pdf", "docx"):
+        raise ValueError("Unsupported file format. Use PDF or DOCX.")
+
+    cache = get_text_cache()
+    key = _text_key(content_hash(data), file_type)
+    text = cache.get(key)
+    if text is None:
+        if file_type == "pdf":
+            text = extract_text_from_pdf(io.BytesIO(data))
+        else:
+            text = extract_text_from_docx(io.BytesIO(data))
+        cache.put(key, text)
+    return text
+
 def clean_text(text: str) -> str:
     """Cleanup: keep line breaks, remove extra spaces, add spacing between sections."""
     lines = [line.strip() for line in text.splitlines()]
@@ -31,4 +146,4 @@ def clean_text(text: str) -> str:
             cleaned_lines.append(line)
             prev_empty = False
 
-    return "\n".join(cleaned_lines).strip()
\ No newline at end of file
+    return "\n".join(cleaned_lines).strip()
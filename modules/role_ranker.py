@@ -0,0 +1,173 @@
+import io
+import math
+import os
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+try:
+    from .job_registry import get_registry
+    from .nlp_analysis import tokenize
+except ImportError:
+    from job_registry import get_registry
+    from nlp_analysis import tokenize
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_DIR = os.getenv("ROLE_RANKER_CACHE_DIR", os.path.join(_PROJECT_DIR, ".cache", "role_ranker"))
+
+# bump whenever tokenization or weighting changes, so persisted matrices are rebuilt
+RANKER_VERSION = "1"
+
+def _tf(count: int) -> float:
+    # sublinear term frequency, so a word repeated all over a resume doesn't drown out the rest
+    return 1.0 + math.log(count)
+
+class RoleRanker:
+    """TF-IDF index over role descriptions, ranking roles by cosine similarity to a resume.
+
+    A role's description is its title plus its keywords, tokenized with
+    `nlp_analysis.tokenize`. Role vectors are L2-normalized and stored
+    column-wise (term -> postings of (role, weight)), so scoring a resume is
+    one sparse product that only touches the postings of terms the resume
+    actually contains, however many roles there are.
+    """
+
+    def __init__(self, roles: Sequence[str], vocabulary: Sequence[str], idf: np.ndarray,
+                 term_ptr: np.ndarray, role_idx: np.ndarray, weights: np.ndarray):
+        self.roles: List[str] = list(roles)
+        self.vocabulary: List[str] = list(vocabulary)
+        self.columns = {term: i for i, term in enumerate(self.vocabulary)}
+        self.idf = idf
+        self.term_ptr = term_ptr
+        self.role_idx = role_idx
+        self.weights = weights
+
+    @classmethod
+    def build(cls, role_keywords: Dict[str, Sequence[str]]) -> "RoleRanker":
+        roles = list(role_keywords)
+        counts = [Counter(tokenize(" ".join([role, *[k for k in keywords if isinstance(k, str)]])))
+                  for role, keywords in role_keywords.items()]
+        vocabulary = sorted({term for c in counts for term in c})
+        columns = {term: i for i, term in enumerate(vocabulary)}
+
+        df = np.zeros(len(vocabulary), dtype=np.float64)
+        for c in counts:
+            for term in c:
+                df[columns[term]] += 1
+        # smoothed idf: terms shared by every role still keep a small positive weight
+        idf = np.log((1 + len(roles)) / (1 + df)) + 1
+
+        postings: List[List[Tuple[int, float]]] = [[] for _ in vocabulary]
+        for r, c in enumerate(counts):
+            row = {columns[term]: _tf(n) * idf[columns[term]] for term, n in c.items()}
+            norm = math.sqrt(sum(w * w for w in row.values())) or 1.0
+            for col, w in row.items():
+                postings[col].append((r, w / norm))
+
+        term_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        term_ptr[1:] = np.cumsum([len(p) for p in postings])
+        role_idx = np.fromiter((r for p in postings for r, _ in p), dtype=np.int64, count=int(term_ptr[-1]))
+        weights = np.fromiter((w for p in postings for _, w in p), dtype=np.float64, count=int(term_ptr[-1]))
+        return cls(roles, vocabulary, idf, term_ptr, role_idx, weights)
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        buf = io.BytesIO()
+        np.savez(buf, roles=np.array(self.roles, dtype=str), vocabulary=np.array(self.vocabulary, dtype=str),
+                 idf=self.idf, term_ptr=self.term_ptr, role_idx=self.role_idx, weights=self.weights)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(buf.getvalue())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "RoleRanker":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["roles"].tolist(), data["vocabulary"].tolist(), data["idf"], data["term_ptr"],
+                       data["role_idx"], data["weights"])
+
+    def vectorize(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(term columns, L2-normalized TF-IDF weights) of `text`; words outside the vocabulary are dropped."""
+        counts = Counter(t for t in tokenize(text) if t in self.columns)
+        cols = np.fromiter((self.columns[t] for t in counts), dtype=np.int64, count=len(counts))
+        weights = np.fromiter((_tf(n) for n in counts.values()), dtype=np.float64, count=len(counts))
+        weights *= self.idf[cols]
+        norm = np.linalg.norm(weights)
+        return cols, (weights / norm if norm else weights)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Cosine similarity (0-1) of `text` to every role, in `roles` order."""
+        cols, query = self.vectorize(text)
+        starts, ends = self.term_ptr[cols], self.term_ptr[cols + 1]
+        lengths = ends - starts
+        # flatten the postings of every query term into one gather
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        products = self.weights[offsets] * np.repeat(query, lengths)
+        return np.bincount(self.role_idx[offsets], weights=products, minlength=len(self.roles))
+
+    def rank(self, text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Top `top_k` (role, similarity %) pairs, best first; ties keep the job file's role order."""
+        scores = self.scores(text)
+        if top_k is None or top_k >= len(scores):
+            top = np.arange(len(scores))
+        elif top_k <= 0:
+            return []
+        else:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            # pull in roles tied with the k-th score so the tie-break below sees all of them
+            top = np.flatnonzero(scores >= scores[top].min())
+        order = top[np.lexsort((top, -scores[top]))][:top_k]
+        return [(self.roles[i], round(float(scores[i]) * 100, 2)) for i in order]
+
+def _cache_path(version: str) -> str:
+    return os.path.join(CACHE_DIR, f"roles-{version}-v{RANKER_VERSION}.npz")
+
+def _remove_stale(keep: str):
+    """Delete persisted matrices other than `keep` (older job files or ranker versions)."""
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.startswith("roles-") and name.endswith(".npz") and path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+_ranker: Optional[RoleRanker] = None
+_ranker_version = None
+_ranker_lock = threading.Lock()
+
+def get_ranker() -> RoleRanker:
+    """RoleRanker for the current job descriptions.
+
+    The matrix is loaded from the on-disk cache when one exists for this
+    version of the job file; otherwise it is built once and persisted, replacing
+    the matrices saved for earlier versions.
+    """
+    global _ranker, _ranker_version
+    registry = get_registry()
+    version = registry.version
+    if _ranker is None or _ranker_version != version:
+        with _ranker_lock:
+            if _ranker is None or _ranker_version != version:
+                path = _cache_path(version)
+                ranker = None
+                if os.path.exists(path):
+                    try:
+                        ranker = RoleRanker.load(path)
+                    except Exception:
+                        ranker = None
+                if ranker is None:
+                    ranker = RoleRanker.build(registry.roles)
+                    try:
+                        ranker.save(path)
+                        _remove_stale(path)
+                    except OSError:
+                        pass
+                _ranker, _ranker_version = ranker, version
+    return _ranker
+
+def rank_roles(resume_text: str, top_k: int = 5) -> List[Tuple[str, float]]:
+    """Roles most similar to the resume as (role, similarity %) pairs, best first."""
+    return get_ranker().rank(resume_text, top_k)
@@ -0,0 +1,82 @@
+import threading
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+
+try:
+    from .job_registry import get_registry
+    from .skill_matcher import get_matcher
+except ImportError:
+    from job_registry import get_registry
+    from skill_matcher import get_matcher
+
+class ScoreMatrix:
+    """Role-by-skill requirement matrix for scoring many resumes at once.
+
+    Skills are columns, roles are rows (a keyword listed twice for a role
+    counts twice, as in `calculate_ats_score`). A resume becomes a 0/1
+    presence row over the same columns, so one matrix product yields the
+    matched-keyword count for every (resume, role) pair. The product runs in
+    float32 so it goes through BLAS, and is rounded back to integer counts
+    (exact well beyond any role's keyword list). Counts are mapped to scores
+    through a per-role lookup table built with the same
+    `round(found / total * 100, 2)` as the scalar path, so values match it exactly.
+    """
+
+    def __init__(self, index: Dict[str, Tuple[str, ...]]):
+        self.roles: List[str] = list(index)
+        self.vocabulary: List[str] = sorted({kw for keywords in index.values() for kw in keywords})
+        self.columns = {kw: i for i, kw in enumerate(self.vocabulary)}
+        self.matcher = get_matcher(self.vocabulary)
+
+        self.requirements = np.zeros((len(self.roles), len(self.vocabulary)), dtype=np.float32)
+        for r, keywords in enumerate(index.values()):
+            for kw in keywords:
+                self.requirements[r, self.columns[kw]] += 1
+
+        lengths = [len(keywords) for keywords in index.values()]
+        self._lookup = np.zeros((len(self.roles), max(lengths, default=0) + 1), dtype=np.float64)
+        for r, total in enumerate(lengths):
+            if total:
+                self._lookup[r, :total + 1] = [round((found / total) * 100, 2) for found in range(total + 1)]
+        self._role_rows = np.arange(len(self.roles))[np.newaxis, :]
+
+    def presence(self, resume_texts: Iterable[str]) -> np.ndarray:
+        """0/1 matrix (resumes x skills) of which vocabulary skills each resume mentions."""
+        texts = list(resume_texts)
+        matrix = np.zeros((len(texts), len(self.vocabulary)), dtype=np.float32)
+        for i, text in enumerate(texts):
+            cols = [self.columns[kw] for kw in self.matcher.scan(text or "") if kw in self.columns]
+            matrix[i, cols] = 1
+        return matrix
+
+    def score_presence(self, presence: np.ndarray) -> np.ndarray:
+        """ATS scores (resumes x roles) from a presence matrix."""
+        counts = np.rint(presence @ self.requirements.T).astype(np.intp)
+        return self._lookup[self._role_rows, counts]
+
+    def score(self, resume_texts: Iterable[str]) -> np.ndarray:
+        return self.score_presence(self.presence(resume_texts))
+
+    def score_dicts(self, resume_texts: Iterable[str]) -> List[Dict[str, float]]:
+        """Per-resume {role: score} dicts, in the shape `get_all_scores` returns."""
+        return [dict(zip(self.roles, row.tolist())) for row in self.score(resume_texts)]
+
+_matrix = None
+_matrix_version = None
+_matrix_lock = threading.Lock()
+
+def get_score_matrix() -> ScoreMatrix:
+    """ScoreMatrix for the current job descriptions, rebuilt when they change."""
+    global _matrix, _matrix_version
+    registry = get_registry()
+    version = registry.version
+    if _matrix is None or _matrix_version != version:
+        with _matrix_lock:
+            if _matrix is None or _matrix_version != version:
+                _matrix = ScoreMatrix(registry.index)
+                _matrix_version = version
+    return _matrix
+
+def score_resumes(resume_texts: Sequence[str]) -> np.ndarray:
+    """Scores for every resume against every role (rows follow `resume_texts`, columns `roles`)."""
+    return get_score_matrix().score(resume_texts)
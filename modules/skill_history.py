@@ -0,0 +1,62 @@
+from typing import Callable, Dict, Optional
+
+try:
+    from .job_registry import get_registry
+    from .perf import traced
+    from .resume_parser import lookup_cached_text
+    from .skill_matcher import find_keywords, get_matcher
+    from .storage_manager import (RescoreCounts, SkillBits, pending_rescore_ready, rescore_analyses,
+                                  rescored_jobs_version, save_resume_skills, stale_resume_hashes, sync_skill_vocab)
+except ImportError:
+    from job_registry import get_registry
+    from perf import traced
+    from resume_parser import lookup_cached_text
+    from skill_matcher import find_keywords, get_matcher
+    from storage_manager import (RescoreCounts, SkillBits, pending_rescore_ready, rescore_analyses,
+                                 rescored_jobs_version, save_resume_skills, stale_resume_hashes, sync_skill_vocab)
+
+# Stored analyses keep a per-resume skill bitset (see storage_manager.SkillBits), so
+# their ATS scores can be recomputed after the job descriptions change without the
+# original documents.
+
+def _scan(resume_text: str, vocab: Dict[str, int]) -> SkillBits:
+    value = 0
+    for skill in find_keywords(resume_text, get_matcher(vocab)):
+        value |= 1 << vocab[skill]
+    return SkillBits(value.to_bytes((len(vocab) + 7) // 8, "little"), len(vocab))
+
+@traced
+def resume_skill_bits(resume_text: str) -> SkillBits:
+    """Bitset of the skills a resume mentions, over every job-description skill seen so far."""
+    return _scan(resume_text, sync_skill_vocab(get_registry().matcher.keywords))
+
+@traced
+def rescore_history(force: bool = False,
+                    lookup_text: Callable[[str], Optional[str]] = lookup_cached_text) -> RescoreCounts:
+    """Re-score stored analyses against the current job descriptions.
+
+    Bitsets scanned before a skill was added are re-scanned from
+    `lookup_text(resume_hash)` (the extracted-text cache by default); when the
+    text is gone, that resume's rows keep their score rather than being scored
+    with skills it was never checked for, and are counted as skipped. Skipped
+    rows are re-scored by a later call once their resume is analyzed again.
+    Otherwise this does nothing unless the job descriptions changed since the
+    last re-score (or with `force`).
+    """
+    registry = get_registry()
+    version = registry.version
+    pending_only = False
+    if not force and rescored_jobs_version() == version:
+        if not pending_rescore_ready():
+            return RescoreCounts(0, 0)
+        pending_only = True
+
+    vocab = sync_skill_vocab(registry.matcher.keywords)
+    if not pending_only:
+        for resume_hash in stale_resume_hashes(len(vocab)):
+            text = lookup_text(resume_hash)
+            if text is not None:
+                save_resume_skills(resume_hash, _scan(text, vocab))
+
+    role_skill_ids = {role: [vocab[kw] for kw in keywords] for role, keywords in registry.index.items()}
+    return rescore_analyses(role_skill_ids, len(vocab), version, pending_only)
@@ -0,0 +1,126 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+def normalize_keyword(keyword: str) -> str:
+    return keyword.lower()
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a fixed keyword set (case-insensitive, whole words).
+
+    A single pass over the text reports every keyword occurrence, so any
+    number of roles can be scored from one scan. An occurrence only counts
+    when it is not part of a longer word: a keyword edge that is a word
+    character must not touch another word character ("java" is not found in
+    "javascript"), while punctuated edges ("c++", ".net") are not checked.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(sorted({normalize_keyword(k) for k in keywords if isinstance(k, str)}))
+        self._vocab = frozenset(self.keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        # which edges of each keyword need a word boundary next to them
+        self._bounded = [(bool(kw) and _is_word_char(kw[0]), bool(kw) and _is_word_char(kw[-1]))
+                         for kw in self.keywords]
+
+        for idx, kw in enumerate(self.keywords):
+            if not kw:
+                continue
+            state = 0
+            for ch in kw:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(idx)
+
+        # breadth-first fail links; outputs are merged so each state lists every keyword ending there
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __contains__(self, keyword: str) -> bool:
+        return normalize_keyword(keyword) in self._vocab
+
+    def covers(self, keywords: Iterable[str]) -> bool:
+        return all(k in self for k in keywords)
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Every keyword that occurs in `text` as a whole word."""
+        text_lower = text.lower()
+        # an empty keyword (sorted first) matches any text, as `"" in text` does
+        found = {0} if "" in self._vocab else set()
+
+        goto, fail, out, keywords, bounded = self._goto, self._fail, self._out, self.keywords, self._bounded
+        last = len(text_lower) - 1
+        state = 0
+        for pos, ch in enumerate(text_lower):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                if idx in found:
+                    continue
+                check_start, check_end = bounded[idx]
+                start = pos - len(keywords[idx]) + 1
+                if check_start and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if check_end and pos < last and _is_word_char(text_lower[pos + 1]):
+                    continue
+                found.add(idx)
+        return frozenset(keywords[idx] for idx in found)
+
+@lru_cache(maxsize=64)
+def _matcher_for(vocab: frozenset) -> SkillMatcher:
+    return SkillMatcher(vocab)
+
+def get_matcher(keywords: Iterable[str]) -> SkillMatcher:
+    """Shared matcher for a keyword set, built on first use."""
+    return _matcher_for(frozenset(normalize_keyword(k) for k in keywords if isinstance(k, str)))
+
+_shared_matcher: Optional[SkillMatcher] = None
+
+def set_shared_vocabulary(keywords: Iterable[str]) -> SkillMatcher:
+    """Make the union of all role keywords the default vocabulary for `match_keywords`."""
+    global _shared_matcher
+    _shared_matcher = get_matcher(keywords)
+    return _shared_matcher
+
+@lru_cache(maxsize=32)
+def _scan(matcher: SkillMatcher, text: str) -> FrozenSet[str]:
+    return matcher.scan(text)
+
+def find_keywords(text: str, matcher: SkillMatcher) -> FrozenSet[str]:
+    """Memoized `matcher.scan(text)`."""
+    return _scan(matcher, text or "")
+
+def match_keywords(text: str, keywords: Iterable[str]) -> FrozenSet[str]:
+    """Normalized keywords that occur in `text` as whole words.
+
+    The text is scanned once per vocabulary; calls for further keyword lists
+    against the same text are served from that scan. Keywords outside the
+    shared vocabulary extend it rather than triggering a separate pass.
+    """
+    keywords = [k for k in keywords if isinstance(k, str)]
+    matcher = _shared_matcher
+    if matcher is None:
+        matcher = get_matcher(keywords)
+    elif not matcher.covers(keywords):
+        matcher = get_matcher(list(matcher.keywords) + keywords)
+    return find_keywords(text, matcher)
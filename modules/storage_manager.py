@@ -1,11 +1,58 @@
+import os
 import sqlite3
-from datetime import datetime
-from typing import List, Tuple, Any
+import threading
+from contextlib import contextmanager
+from datetime import date as _date, datetime
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
-DB_NAME = "analysis_history.db"
+try:
+    from .perf import traced
+except ImportError:
+    from perf import traced
 
+DB_NAME = os.getenv("ANALYSIS_HISTORY_DB", "analysis_history.db")
+
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KIB = 8192
+
+_local = threading.local()
+
+def get_connection() -> sqlite3.Connection:
+    """Connection reused by every call on the current thread (WAL mode, busy timeout)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "db_name", None) != DB_NAME:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(DB_NAME, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        conn.create_function("compute_points", 2, _compute_points, deterministic=True)
+        _local.conn = conn
+        _local.db_name = DB_NAME
+    return conn
+
+def close_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+@contextmanager
+def transaction():
+    """Commit on success, roll back on error, on this thread's connection."""
+    conn = get_connection()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+@traced
 def init_db():
-    conn = sqlite3.connect(DB_NAME)
+    conn = get_connection()
     c = conn.cursor()
 
     c.execute("""
@@ -31,8 +78,265 @@ def init_db():
             conn.commit()
         except Exception:
             pass
+    if "resume_hash" not in cols:
+        try:
+            c.execute("ALTER TABLE history ADD COLUMN resume_hash TEXT")
+            conn.commit()
+        except Exception:
+            pass
+
+    # covering index for per-user history pages: seek on (username, date, id), read every column from the index
+    c.execute("DROP INDEX IF EXISTS idx_history_username_date")
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_history_user_date_cover
+        ON history(username, date, id, role, ats_score, repositories, followers, contributions, points)
+    """)
+    # lets recalc_all_points find rows still missing points without scanning the table
+    c.execute("CREATE INDEX IF NOT EXISTS idx_history_points_pending ON history(id) WHERE points IS NULL OR points = 0")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_history_resume_hash ON history(resume_hash) WHERE resume_hash IS NOT NULL")
+    _init_user_stats(conn)
+    _init_skill_tables(conn)
+    conn.commit()
+
+# user_stats is a per-user rollup of history kept current by triggers, so the
+# leaderboard reads ten rows off an index instead of aggregating the whole table.
+_STATS_ADD = """
+    INSERT OR IGNORE INTO user_stats (username) VALUES ({row}.username);
+    UPDATE user_stats SET
+        ats_sum = ats_sum + COALESCE({row}.ats_score, 0),
+        ats_count = ats_count + ({row}.ats_score IS NOT NULL),
+        total_contributions = total_contributions + COALESCE({row}.contributions, 0),
+        total_points = total_points + COALESCE({row}.points, 0),
+        entries = entries + 1
+    WHERE username = {row}.username;
+    UPDATE user_stats SET avg_score = CASE WHEN ats_count > 0 THEN ats_sum / ats_count END
+    WHERE username = {row}.username;
+"""
+
+_STATS_REMOVE = """
+    UPDATE user_stats SET
+        ats_sum = ats_sum - COALESCE({row}.ats_score, 0),
+        ats_count = ats_count - ({row}.ats_score IS NOT NULL),
+        total_contributions = total_contributions - COALESCE({row}.contributions, 0),
+        total_points = total_points - COALESCE({row}.points, 0),
+        entries = entries - 1
+    WHERE username = {row}.username;
+    UPDATE user_stats SET avg_score = CASE WHEN ats_count > 0 THEN ats_sum / ats_count END
+    WHERE username = {row}.username;
+    DELETE FROM user_stats WHERE username = {row}.username AND entries <= 0;
+"""
+
+def _init_user_stats(conn: sqlite3.Connection):
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'user_stats'").fetchone()
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS user_stats (
+            username TEXT PRIMARY KEY,
+            ats_sum REAL NOT NULL DEFAULT 0,
+            ats_count INTEGER NOT NULL DEFAULT 0,
+            avg_score REAL,
+            total_contributions INTEGER NOT NULL DEFAULT 0,
+            total_points INTEGER NOT NULL DEFAULT 0,
+            entries INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_user_stats_rank
+        ON user_stats(avg_score DESC, total_contributions DESC)
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_history_stats_insert AFTER INSERT ON history
+        WHEN NEW.username IS NOT NULL
+        BEGIN {_STATS_ADD.format(row="NEW")} END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_history_stats_delete AFTER DELETE ON history
+        WHEN OLD.username IS NOT NULL
+        BEGIN {_STATS_REMOVE.format(row="OLD")} END
+    """)
+    # an update is a removal of the old row plus an insertion of the new one
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_history_stats_update_old
+        AFTER UPDATE OF username, ats_score, contributions, points ON history
+        WHEN OLD.username IS NOT NULL
+        BEGIN {_STATS_REMOVE.format(row="OLD")} END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_history_stats_update_new
+        AFTER UPDATE OF username, ats_score, contributions, points ON history
+        WHEN NEW.username IS NOT NULL
+        BEGIN {_STATS_ADD.format(row="NEW")} END
+    """)
+
+    if not exists:
+        rebuild_user_stats(conn)
+
+def rebuild_user_stats(conn: sqlite3.Connection = None):
+    """Recompute the whole user_stats rollup from history."""
+    conn = conn or get_connection()
+    conn.execute("DELETE FROM user_stats")
+    conn.execute("""
+        INSERT INTO user_stats (username, ats_sum, ats_count, avg_score, total_contributions, total_points, entries)
+        SELECT username,
+               COALESCE(SUM(ats_score), 0),
+               COUNT(ats_score),
+               AVG(ats_score),
+               COALESCE(SUM(contributions), 0),
+               COALESCE(SUM(points), 0),
+               COUNT(*)
+        FROM history
+        WHERE username IS NOT NULL
+        GROUP BY username
+    """)
+    conn.commit()
+
+# Skill presence per analyzed resume, stored as a bitset over skill_vocab ids and keyed
+# by the file's content hash. skill_vocab is append-only, so a skill keeps its bit
+# forever; a bitset covers the first `vocab_size` skills, the vocabulary as it was
+# when the resume was scanned. Scanning and re-scoring live in skill_history.
+def _init_skill_tables(conn: sqlite3.Connection):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS skill_vocab (
+            id INTEGER PRIMARY KEY,
+            skill TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS resume_skills (
+            resume_hash TEXT PRIMARY KEY,
+            bits BLOB NOT NULL,
+            vocab_size INTEGER NOT NULL,
+            updated TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+    # resumes whose rows the last re-score had to skip (bitset older than the vocabulary)
+    conn.execute("CREATE TABLE IF NOT EXISTS rescore_pending (resume_hash TEXT PRIMARY KEY)")
+
+class SkillBits(NamedTuple):
+    """Skills found in one resume: bit i of `bits` (little-endian) is skill_vocab id i, for ids below `vocab_size`."""
+    bits: bytes
+    vocab_size: int
+
+def sync_skill_vocab(skills: Iterable[str]) -> Dict[str, int]:
+    """Append any of `skills` missing from skill_vocab; returns the whole vocabulary as skill -> bit position."""
+    with transaction() as conn:
+        vocab = dict(conn.execute("SELECT skill, id FROM skill_vocab"))
+        new = [(skill,) for skill in skills if skill not in vocab]
+        if new:
+            # ids are assigned inside each statement, so concurrent writers can't hand out the same bit
+            conn.executemany("""
+                INSERT OR IGNORE INTO skill_vocab (id, skill)
+                SELECT COALESCE(MAX(id) + 1, 0), ? FROM skill_vocab
+            """, new)
+            vocab = dict(conn.execute("SELECT skill, id FROM skill_vocab"))
+    return vocab
+
+def _put_resume_skills(conn: sqlite3.Connection, rows: Iterable[Tuple[str, SkillBits]]):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn.executemany("""
+        INSERT OR REPLACE INTO resume_skills (resume_hash, bits, vocab_size, updated)
+        VALUES (?, ?, ?, ?)
+    """, [(resume_hash, skills.bits, skills.vocab_size, now) for resume_hash, skills in rows])
+
+@traced
+def save_resume_skills(resume_hash: str, skills: SkillBits):
+    with transaction() as conn:
+        _put_resume_skills(conn, [(resume_hash, skills)])
+
+def stale_resume_hashes(vocab_size: int) -> List[str]:
+    """Resumes whose stored bitset was scanned against fewer than `vocab_size` skills."""
+    rows = get_connection().execute("SELECT resume_hash FROM resume_skills WHERE vocab_size < ?", (vocab_size,))
+    return [resume_hash for (resume_hash,) in rows]
+
+def rescored_jobs_version() -> Optional[str]:
+    """Job-descriptions version the history was last re-scored against."""
+    row = get_connection().execute("SELECT value FROM meta WHERE key = 'jobs_version'").fetchone()
+    return row[0] if row else None
+
+def pending_rescore_ready() -> bool:
+    """Whether a resume skipped by the last re-score has since been given a complete bitset."""
+    # skill_vocab ids are 0..n-1, so COUNT(*) is the current vocabulary size
+    return get_connection().execute("""
+        SELECT 1 FROM rescore_pending AS p JOIN resume_skills AS r ON r.resume_hash = p.resume_hash
+        WHERE r.vocab_size >= (SELECT COUNT(*) FROM skill_vocab)
+        LIMIT 1
+    """).fetchone() is not None
+
+class RescoreCounts(NamedTuple):
+    """Rows re-scored with a new value, and rows left alone because their resume's bitset is incomplete."""
+    changed: int
+    skipped: int
 
-    conn.close()
+def _role_scorer(role_skill_ids: Mapping[str, Sequence[int]]):
+    def role_score(bits, role):
+        ids = role_skill_ids.get(role)
+        if bits is None or ids is None:
+            return None
+        if not ids:
+            return 0
+        value = int.from_bytes(bits, "little")
+        found = sum(1 for i in ids if value >> i & 1)
+        return round((found / len(ids)) * 100, 2)
+    return role_score
+
+@traced
+def rescore_analyses(role_skill_ids: Mapping[str, Sequence[int]], vocab_size: int, jobs_version: str,
+                     pending_only: bool = False) -> RescoreCounts:
+    """Recompute ats_score and points of stored analyses from their resumes' skill bitsets.
+
+    `role_skill_ids` maps each role to the skill_vocab ids of its keywords.
+    Rows whose bitset covers fewer than `vocab_size` skills, and rows of
+    unknown roles, keep their score; the former are counted as skipped and
+    their resumes recorded in rescore_pending (see `pending_rescore_ready`).
+    With `pending_only`, only rows of those recorded resumes are re-scored.
+    `jobs_version` is recorded for `rescored_jobs_version`.
+    """
+    with transaction() as conn:
+        conn.create_function("role_score", 2, _role_scorer(role_skill_ids), deterministic=True)
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS rescored (id INTEGER PRIMARY KEY, score REAL NOT NULL)")
+        conn.execute("DELETE FROM temp.rescored")
+        conn.execute("""
+            INSERT INTO temp.rescored (id, score)
+            SELECT id, score FROM (
+                SELECT h.id AS id, role_score(r.bits, h.role) AS score
+                FROM history AS h JOIN resume_skills AS r ON r.resume_hash = h.resume_hash
+                WHERE r.vocab_size >= ?
+                  AND (NOT ? OR h.resume_hash IN (SELECT resume_hash FROM rescore_pending))
+            )
+            WHERE score IS NOT NULL
+        """, (vocab_size, pending_only))
+        conn.execute("""
+            DELETE FROM temp.rescored
+            WHERE score IS (SELECT ats_score FROM history WHERE history.id = rescored.id)
+        """)
+        # correlated primary-key lookups rather than UPDATE ... FROM, which needs SQLite 3.33+
+        changed = conn.execute("""
+            UPDATE history
+            SET ats_score = (SELECT score FROM temp.rescored AS s WHERE s.id = history.id),
+                points = compute_points((SELECT score FROM temp.rescored AS s WHERE s.id = history.id), contributions)
+            WHERE id IN (SELECT id FROM temp.rescored)
+        """).rowcount
+        conn.execute("DROP TABLE temp.rescored")
+        conn.execute("DELETE FROM rescore_pending")
+        conn.execute("""
+            INSERT INTO rescore_pending (resume_hash)
+            SELECT DISTINCT h.resume_hash
+            FROM history AS h JOIN resume_skills AS r ON r.resume_hash = h.resume_hash
+            WHERE r.vocab_size < ?
+        """, (vocab_size,))
+        skipped = conn.execute("""
+            SELECT COUNT(*) FROM history
+            WHERE resume_hash IN (SELECT resume_hash FROM rescore_pending)
+        """).fetchone()[0]
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('jobs_version', ?)", (jobs_version,))
+    return RescoreCounts(changed, skipped)
 
 def _safe_int(value: Any) -> int:
     try:
@@ -50,71 +354,138 @@ def _compute_points(ats_score: Any, contributions: Any) -> int:
     bonus = contrib // 10
     return max(0, base + bonus)
 
-def save_analysis(username: str, role: str, ats_score: float, repos: Any, followers: Any, contributions: Any):
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+_INSERT_HISTORY = """
+    INSERT INTO history (username, role, ats_score, repositories, followers, contributions, points, date, resume_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _history_row(username: str, role: str, ats_score: float, repos: Any, followers: Any, contributions: Any,
+                 date: str = None, resume_hash: str = None) -> Tuple:
+    date = date or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     repos_i = _safe_int(repos)
     followers_i = _safe_int(followers)
     contributions_i = _safe_int(contributions)
     points = _compute_points(ats_score, contributions_i)
+    return (username, role, ats_score, repos_i, followers_i, contributions_i, points, date, resume_hash)
 
-    c.execute("""
-        INSERT INTO history (username, role, ats_score, repositories, followers, contributions, points, date)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    """, (username, role, ats_score, repos_i, followers_i, contributions_i, points, date))
+@traced
+def save_analysis(username: str, role: str, ats_score: float, repos: Any, followers: Any, contributions: Any,
+                  resume_hash: str = None, resume_skills: SkillBits = None):
+    """Store one analysis.
 
-    conn.commit()
-    conn.close()
+    With the resume's content hash and skill bitset (skill_history.resume_skill_bits),
+    both are written in the same transaction and the row can be re-scored later.
+    """
+    with transaction() as conn:
+        conn.execute(_INSERT_HISTORY, _history_row(username, role, ats_score, repos, followers, contributions,
+                                                   resume_hash=resume_hash))
+        if resume_hash and resume_skills is not None:
+            _put_resume_skills(conn, [(resume_hash, resume_skills)])
+
+@traced
+def save_analyses(rows: Iterable[Mapping[str, Any]]) -> int:
+    """Insert many analyses in one transaction.
 
+    Each row takes the keyword arguments of `save_analysis` (plus an optional
+    `date`). Returns the number of rows written.
+    """
+    params, skills = [], []
+    for row in rows:
+        row = dict(row)
+        resume_skills = row.pop("resume_skills", None)
+        if row.get("resume_hash") and resume_skills is not None:
+            skills.append((row["resume_hash"], resume_skills))
+        params.append(_history_row(**row))
+    if params:
+        with transaction() as conn:
+            conn.executemany(_INSERT_HISTORY, params)
+            _put_resume_skills(conn, skills)
+    return len(params)
+
+@traced
 def get_user_history(username: str) -> List[Tuple]:
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
+    c = get_connection().cursor()
     c.execute("""
         SELECT role, ats_score, repositories, followers, contributions, points, date
         FROM history
         WHERE username = ?
         ORDER BY date DESC
     """, (username,))
-    data = c.fetchall()
-    conn.close()
-    return data
+    return c.fetchall()
 
+def _date_bound(value) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, _date):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+@traced
+def get_user_history_page(username: str, limit: int = 50, cursor: Optional[Tuple[str, int]] = None,
+                          since=None, until=None) -> Tuple[List[Tuple], Optional[Tuple[str, int]]]:
+    """One page of a user's history, newest first.
+
+    `since` is inclusive and `until` exclusive (dates, datetimes or date strings).
+    Pass the returned cursor back to get the next (older) page; it is None on
+    the last page.
+    """
+    clauses = ["username = ?"]
+    params: List[Any] = [username]
+    since, until = _date_bound(since), _date_bound(until)
+    if since is not None:
+        clauses.append("date >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("date < ?")
+        params.append(until)
+    if cursor is not None:
+        clauses.append("(date, id) < (?, ?)")
+        params.extend(cursor)
+    params.append(limit + 1)
+
+    rows = get_connection().execute(f"""
+        SELECT id, role, ats_score, repositories, followers, contributions, points, date
+        FROM history
+        WHERE {" AND ".join(clauses)}
+        ORDER BY date DESC, id DESC
+        LIMIT ?
+    """, params).fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = (rows[-1][7], rows[-1][0])
+    return [row[1:] for row in rows], next_cursor
+
+@traced
+def clear_user_history(username: str):
+    with transaction() as conn:
+        conn.execute("DELETE FROM history WHERE username = ?", (username,))
+
+@traced
 def get_leaderboard() -> List[Tuple]:
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
+    c = get_connection().cursor()
     c.execute("""
-        SELECT username,
-               AVG(ats_score) as avg_score,
-               SUM(contributions) as total_contributions,
-               SUM(points) as total_points
-        FROM history
-        GROUP BY username
+        SELECT username, avg_score, total_contributions, total_points
+        FROM user_stats
         ORDER BY avg_score DESC, total_contributions DESC
         LIMIT 10
     """)
-    leaderboard = c.fetchall()
-    conn.close()
-    return leaderboard
+    return c.fetchall()
 
+@traced
 def recalc_all_points():
-
-    conn = sqlite3.connect(DB_NAME)
-    c = conn.cursor()
-    try:
-        rows = c.execute("""
-            SELECT id, ats_score, contributions
-            FROM history
-            WHERE points IS NULL OR points = 0
-        """).fetchall()
-    except sqlite3.OperationalError:
-        rows = []
-
-    for row in rows:
-        row_id, ats, contrib = row
-        pts = _compute_points(ats, contrib)
-        c.execute("UPDATE history SET points = ? WHERE id = ?", (pts, row_id))
-
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    """Fill in points for rows that have none, in a single set-based UPDATE."""
+    with transaction() as conn:
+        try:
+            conn.execute("""
+                UPDATE history
+                SET points = compute_points(ats_score, contributions)
+                WHERE (points IS NULL OR points = 0)
+                  AND compute_points(ats_score, contributions) != COALESCE(points, -1)
+            """)
+        except sqlite3.OperationalError:
+            pass
\ No newline at end of file
@@ -0,0 +1,118 @@
+import hashlib
+import os
+import threading
+from typing import Optional
+
+try:
+    from .perf import cache_event
+except ImportError:
+    from perf import cache_event
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_DIR = os.getenv("RESUME_TEXT_CACHE_DIR", os.path.join(_PROJECT_DIR, ".cache", "resume_text"))
+MAX_CACHE_BYTES = int(os.getenv("RESUME_TEXT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+class TextCache:
+    """On-disk cache of extracted resume text, one file per key.
+
+    Hits refresh the entry's mtime, and writes evict the least recently used
+    entries once the directory grows past `max_bytes`. The directory size is
+    scanned once and then tracked per write; only an eviction rescans it (which
+    also picks up files written by other processes).
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.txt")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.stats["misses"] += 1
+            cache_event("text_cache", False)
+            return None
+        with self._lock:
+            self.stats["hits"] += 1
+        cache_event("text_cache", True)
+        return text
+
+    def put(self, key: str, text: str):
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            size = os.stat(tmp).st_size
+            with self._lock:
+                if self._total is None:
+                    self._total = sum(entry[1] for entry in self._entries())
+                try:
+                    replaced = os.stat(path).st_size
+                except OSError:
+                    replaced = 0
+                os.replace(tmp, path)
+                self._total += size - replaced
+                if self._total > self.max_bytes:
+                    self._evict()
+        except OSError:
+            pass
+
+    def _entries(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".txt"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        # called with _lock held
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats["evictions"] += 1
+        self._total = total
+
+    def clear(self):
+        with self._lock:
+            self._total = None
+            if not os.path.isdir(self.directory):
+                return
+            for name in os.listdir(self.directory):
+                if name.endswith(".txt"):
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                    except OSError:
+                        pass
+
+_cache: Optional[TextCache] = None
+
+def get_text_cache() -> TextCache:
+    global _cache
+    if _cache is None:
+        _cache = TextCache()
+    return _cache
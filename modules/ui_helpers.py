@@ -1,16 +1,21 @@
 import streamlit as st
-import json
 import os
 import io
-import matplotlib.pyplot as plt
+
+try:
+    from .job_registry import get_registry
+    from . import charts
+except ImportError:
+    from job_registry import get_registry
+    import charts
 
 # job role
-def load_job_roles(json_file: str = "job_descriptions.json"):
+def load_job_roles(json_file: str = None):
     try:
+        if json_file is None:
+            return get_registry().roles
         base_dir = os.path.dirname(__file__)
-        file_path = os.path.join(base_dir, json_file)
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return get_registry(os.path.join(base_dir, json_file)).roles
     except FileNotFoundError:
         st.error("⚠️ Job descriptions file not found!")
         return {}
@@ -18,9 +23,21 @@ def load_job_roles(json_file: str = "job_descriptions.json"):
         st.error(f"⚠️ Could not load job roles: {e}")
         return {}
 
-def select_job_role(job_roles: dict):
+def select_job_role(job_roles: dict, best_fit: dict = None, similar: list = None):
     st.subheader("💼 Select Job Role for Analysis")
-    role = st.selectbox("Choose a job role:", list(job_roles.keys()))
+    best_fit = best_fit or {}
+
+    def label(role):
+        if role in best_fit:
+            return f"⭐ {role} (best fit: {best_fit[role]}%)"
+        return role
+
+    if best_fit:
+        st.caption("⭐ Best fit: " + ", ".join(f"{role} ({score}%)" for role, score in best_fit.items()))
+    similar = [(role, score) for role, score in similar or [] if score > 0]
+    if similar:
+        st.caption("🧭 Closest by description: " + ", ".join(f"{role} ({score}%)" for role, score in similar))
+    role = st.selectbox("Choose a job role:", list(job_roles.keys()), format_func=label)
     return role, job_roles[role]
 
 # resume ui
@@ -32,10 +49,10 @@ def display_resume_preview(resume_text: str):
     with st.expander("Show extracted text", expanded=False):
         st.text_area("Resume Preview", resume_text, height=320, label_visibility="collapsed")
 
-def display_keyword_analysis(result: dict):
+def display_keyword_analysis(result):
     st.subheader("🔎 Keyword Analysis")
-    found = ", ".join(result.get('found', [])) if result.get('found') else "None"
-    missing = ", ".join(result.get('missing', [])) if result.get('missing') else "None"
+    found = ", ".join(result.found) if result.found else "None"
+    missing = ", ".join(result.missing) if result.missing else "None"
     st.markdown(f"✅ **Found Keywords:** {found}")
     st.markdown(f"❌ **Missing Keywords:** {missing}")
 
@@ -55,13 +72,19 @@ def display_feedback(feedback):
     for line in lines:
         st.markdown(f"- {line}")
 
-def show_summary(result: dict):
+def show_summary(result):
     st.subheader("📊 Skills Summary")
-    found_count = len(result.get('found', []))
-    missing_count = len(result.get('missing', []))
+    found_count = len(result.found)
+    missing_count = len(result.missing)
     st.write(f"- Found: {found_count}")
     st.write(f"- Missing: {missing_count}")
 
+# skill frequencies are kept as SkillCount tuples; pandas only comes in for st.dataframe
+def skill_frame(skill_counts):
+    import pandas as pd
+
+    return pd.DataFrame(skill_counts, columns=["Skill", "Count"])
+
 # portfolio ui
 def display_portfolio_feedback(feedback):
     st.subheader("💬 Portfolio Feedback")
@@ -129,18 +152,46 @@ def show_combined_visualization(resume_skills: dict, github_langs: dict):
 
     with col1:
         st.subheader("Resume Skill Distribution")
-        fig1, ax1 = plt.subplots(figsize=(4, 4))
-        ax1.pie(resume_skills.values(), labels=resume_skills.keys(), autopct='%1.1f%%', startangle=140)
-        ax1.axis("equal")
-        st.pyplot(fig1)
+        st.image(charts.pie_chart(resume_skills.keys(), resume_skills.values(), figsize=(4, 4), startangle=140), use_container_width=True)
 
     with col2:
         st.subheader("GitHub Language Distribution")
-        fig2, ax2 = plt.subplots(figsize=(4, 4))
-        ax2.bar(github_langs.keys(), github_langs.values())
-        ax2.set_xlabel("Languages")
-        ax2.set_ylabel("Lines of Code")
-        plt.xticks(rotation=45)
-        st.pyplot(fig2)
-
-    st.markdown("✅ **Insight:** The closer the resume skill ratio matches GitHub language ratio, the stronger your profile alignment.")
\ No newline at end of file
+        st.image(charts.language_bar_chart(github_langs.keys(), github_langs.values(), title=None, figsize=(4, 4)), use_container_width=True)
+
+    st.markdown("✅ **Insight:** The closer the resume skill ratio matches GitHub language ratio, the stronger your profile alignment.")
+# performance breakdown
+def _stage_rows(snapshot: dict):
+    rows = [{
+        "Stage": name,
+        "Calls": stage["calls"],
+        "Total (ms)": round(stage["total_seconds"] * 1000, 1),
+        "Max (ms)": round(stage["max_seconds"] * 1000, 1),
+        "Errors": stage["errors"]} for name, stage in snapshot["stages"].items()]
+    return sorted(rows, key=lambda row: row["Total (ms)"], reverse=True)
+
+def show_performance_panel(run, session):
+    with st.expander("⏱️ Performance", expanded=False):
+        st.caption("Wall time per stage; a stage's time includes the traced stages it calls.")
+        run_snapshot, session_snapshot = run.snapshot(), session.snapshot()
+
+        col1, col2 = st.columns(2)
+        for col, title, snapshot in ((col1, "This rerun", run_snapshot), (col2, "This session", session_snapshot)):
+            with col:
+                st.markdown(f"**{title}**")
+                rows = _stage_rows(snapshot)
+                if rows:
+                    st.dataframe(rows, use_container_width=True, hide_index=True)
+                else:
+                    st.write("Nothing recorded yet.")
+
+        caches = [{"Cache": name, "Hits": cache["hits"], "Misses": cache["misses"]}
+                  for name, cache in sorted(session_snapshot["caches"].items())]
+        if caches:
+            st.markdown("**Cache hits (session)**")
+            st.dataframe(caches, use_container_width=True, hide_index=True)
+        st.caption(f"Live matplotlib figures: {charts.live_figure_count()}")
+
+        d1, d2 = st.columns(2)
+        d1.download_button("Download JSON", session.to_json(), file_name="perf_session.json", mime="application/json")
+        d2.download_button("Download Prometheus metrics", session.to_prometheus(), file_name="perf_session.prom",
+                           mime="text/plain")
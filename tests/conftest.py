@@ -0,0 +1,35 @@
+import itertools
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_DIR not in sys.path:
+    sys.path.insert(0, _PROJECT_DIR)
+
+# keep the on-disk caches and the history database out of the working tree; these are
+# read when the modules are first imported, so they are set before any test imports them
+_TMP = tempfile.mkdtemp(prefix="resume_tests_")
+os.environ.setdefault("RESUME_TEXT_CACHE_DIR", os.path.join(_TMP, "resume_text"))
+os.environ.setdefault("GITHUB_CACHE_PATH", os.path.join(_TMP, "github_http.sqlite"))
+os.environ.setdefault("ROLE_RANKER_CACHE_DIR", os.path.join(_TMP, "role_ranker"))
+os.environ.setdefault("ANALYSIS_HISTORY_DB", os.path.join(_TMP, "analysis_history.db"))
+
+@pytest.fixture
+def job_roles(tmp_path):
+    """`with job_roles({role: keywords}):` makes those roles the default job descriptions."""
+    from modules.job_registry import JobRegistry, use_registry
+
+    counter = itertools.count()
+
+    @contextmanager
+    def override(roles):
+        path = tmp_path / f"job_descriptions_{next(counter)}.json"
+        path.write_text(json.dumps(roles), encoding="utf-8")
+        with use_registry(JobRegistry([str(path)], write_default=False, shared=True)):
+            yield
+    return override
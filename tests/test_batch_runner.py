@@ -0,0 +1,84 @@
+import json
+import os
+
+from benchmarks.synthetic import resume_docx, synthetic_resume
+from modules import batch_runner
+from modules.ats_score import get_all_scores
+from modules.batch_runner import load_checkpoint, run_batch
+from modules.resume_parser import extract_resume_text
+
+def _write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+def _resumes(root, count):
+    os.makedirs(root, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(root, f"resume_{i}.docx")
+        _write(path, resume_docx(synthetic_resume(150, seed=i)))
+        paths.append(path)
+    return paths
+
+def _records(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def _crash_on_marked(path):
+    # stands in for a worker killed mid-parse (OOM, segfault in a native parser)
+    if "crash" in os.path.basename(path):
+        os._exit(1)
+    return _extract(path)
+
+_extract = batch_runner.extract_resume_text
+
+def test_resume_skips_scored_files_and_retries_failures(tmp_path):
+    root = str(tmp_path / "resumes")
+    good = _resumes(root, 3)
+    broken = os.path.join(root, "broken.docx")
+    _write(broken, b"not a docx")
+    output = str(tmp_path / "out.jsonl")
+
+    first = run_batch(root, output, workers=2, progress=None)
+    assert first == {"total": 4, "skipped": 0, "scored": 3, "errors": 1}
+    assert load_checkpoint(output + ".checkpoint") == set(good)
+
+    # files that are no longer in the input tree don't count as skipped
+    os.remove(good[0])
+    second = run_batch(root, output, workers=2, progress=None)
+    assert second == {"total": 1, "skipped": 2, "scored": 0, "errors": 1}
+
+    _write(broken, resume_docx(synthetic_resume(150, seed=9)))
+    third = run_batch(root, output, workers=2, progress=None)
+    assert third == {"total": 1, "skipped": 2, "scored": 1, "errors": 0}
+    assert run_batch(root, output, workers=2, progress=None)["total"] == 0
+
+    records = _records(output)
+    # results arrive in completion order; each file is scored exactly once across the runs
+    assert sorted(r["file"] for r in records if not r["error"]) == sorted(good + [broken])
+    assert all(r["scores"] for r in records if not r["error"])
+    for record in records:
+        if not record["error"] and os.path.exists(record["file"]):
+            assert record["scores"] == get_all_scores(extract_resume_text(record["file"]))
+
+def test_dead_worker_fails_its_files_and_the_run_continues(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_runner, "extract_resume_text", _crash_on_marked)
+    root = str(tmp_path / "resumes")
+    good = _resumes(root, 6)
+    crash = os.path.join(root, "crash.docx")
+    _write(crash, resume_docx(synthetic_resume(150)))
+    output = str(tmp_path / "out.jsonl")
+
+    summary = run_batch(root, output, workers=1, progress=None)
+    assert summary["scored"] + summary["errors"] == 7
+    failed = {r["file"] for r in _records(output) if r["error"]}
+    assert crash in failed
+    assert all(r["error"].startswith("BrokenProcessPool") for r in _records(output) if r["error"])
+    assert load_checkpoint(output + ".checkpoint") == set(good) - failed
+
+    # the files that went down with the worker are picked up again on resume
+    monkeypatch.setattr(batch_runner, "extract_resume_text", _extract)
+    os.remove(crash)
+    summary = run_batch(root, output, workers=1, progress=None)
+    assert summary["errors"] == 0
+    assert load_checkpoint(output + ".checkpoint") == set(good)
@@ -0,0 +1,31 @@
+from modules import perf
+from modules.dashboard_cache import _cache_data, cached_ats_score, cached_skill_match
+
+@_cache_data(show_spinner=False)
+def _double(value: int, _note: str) -> int:
+    return value * 2
+
+@_cache_data(show_spinner=False)
+def _fails(value: int) -> int:
+    raise ValueError(value)
+
+def test_wrappers_report_hits_and_misses():
+    text = "Python, SQL and Docker"
+    with perf.use(perf.Recorder()) as recorder:
+        assert _double(2, "a") == 4
+        assert _double(2, "b") == 4  # underscore arguments are still left out of the key
+        assert _double(3, "a") == 6
+        for _ in range(2):
+            try:
+                _fails(1)
+            except ValueError:
+                pass
+        # same hashed arguments, different functions: separate cache entries
+        assert not isinstance(cached_ats_score("h", "Role", "v", text), dict)
+        assert isinstance(cached_skill_match("h", "Role", "v", text, ["Python"]), dict)
+        cached_ats_score("h", "Role", "v", text)
+    caches = recorder.snapshot()["caches"]
+    assert caches["double"] == {"hits": 1, "misses": 2}
+    assert caches["fails"] == {"hits": 0, "misses": 2}
+    assert caches["cached_ats_score"] == {"hits": 1, "misses": 1}
+    assert caches["cached_skill_match"] == {"hits": 0, "misses": 1}
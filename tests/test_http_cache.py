@@ -0,0 +1,48 @@
+from modules.http_cache import HttpCache
+
+class _Response:
+    def __init__(self, content):
+        self.status_code = 200
+        self.content = content
+        self.headers = {}
+
+class _Session:
+    def __init__(self, sizes):
+        self.sizes = sizes
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        return _Response(b"x" * self.sizes[url])
+
+def _totals(cache):
+    conn = cache._connect()
+    tracked = conn.execute("SELECT value FROM meta WHERE key = 'total_size'").fetchone()[0]
+    return tracked, conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+def test_tracked_size_follows_stores_and_evictions(tmp_path):
+    path = str(tmp_path / "http.sqlite")
+    cache = HttpCache(path, max_bytes=1000)
+    session = _Session({"a": 300, "b": 400, "c": 500})
+    cache.get(session, "a", ttl=0)
+    cache.get(session, "b", ttl=0)
+    assert _totals(cache) == (700, 700)
+
+    session.sizes["a"] = 100  # re-fetching replaces the stored body's size
+    cache.get(session, "a", ttl=0)
+    assert _totals(cache) == (500, 500)
+
+    cache.get(session, "c", ttl=0)  # exactly max_bytes: nothing is evicted yet
+    session.sizes["a"] = 200  # past max_bytes: b, the least recently used, goes
+    cache.get(session, "a", ttl=0)
+    assert _totals(cache) == (700, 700)
+    keys = {k for (k,) in cache._connect().execute("SELECT key FROM responses")}
+    assert keys == {"a", "c"}
+
+    cache.clear()
+    assert _totals(cache) == (0, 0)
+
+    # a database written before the size was tracked is summed once on open
+    conn = cache._connect()
+    conn.execute("INSERT INTO responses (key, status, body, size) VALUES ('old', 200, x'00', 40)")
+    conn.execute("DELETE FROM meta")
+    conn.commit()
+    assert _totals(HttpCache(path)) == (40, 40)
@@ -0,0 +1,34 @@
+import pytest
+from reportlab import rl_config
+
+from benchmarks.synthetic import synthetic_resume
+from modules import charts
+from modules.keyword_analysis import analyze_keywords
+from modules.nlp_analysis import get_skill_frequencies
+from modules.report_generator import generate_pdf_report, submit_pdf_report
+
+PORTFOLIO = {"username": "octocat", "repositories": 8, "followers": 20, "contributions": 310,
+             "top_languages": {"Python": 52000, "JavaScript": 18000, "Go": 4000}}
+
+@pytest.fixture
+def invariant_pdfs(monkeypatch):
+    # fixed creation dates and document ids, so identical reports are byte-identical
+    monkeypatch.setattr(rl_config, "invariant", 1)
+
+def _report_args(seed):
+    text = synthetic_resume(400, seed=seed)
+    result = analyze_keywords(text, ["Python", "SQL", "Docker", "Kubernetes"])
+    return ("Data Scientist", result, "Add more projects.", 50.0, PORTFOLIO, get_skill_frequencies(text))
+
+def test_background_reports_match_serial_ones(invariant_pdfs):
+    expected = []
+    for seed in range(4):
+        charts.clear_cache()
+        expected.append(generate_pdf_report(*_report_args(seed)))
+    assert len(set(expected)) == 4
+
+    charts.clear_cache()
+    futures = [submit_pdf_report(*_report_args(seed)) for seed in range(4) for _ in range(2)]
+    pdfs = [future.result(timeout=60) for future in futures]
+    assert pdfs == [pdf for pdf in expected for _ in range(2)]
+    assert all(pdf.startswith(b"%PDF") for pdf in pdfs)
@@ -0,0 +1,22 @@
+import io
+
+import pytest
+
+from benchmarks.synthetic import resume_pdf, synthetic_resume
+from modules.resume_parser import iter_pdf_pages
+
+@pytest.fixture(scope="module")
+def pdf_bytes():
+    return resume_pdf(synthetic_resume(3000))
+
+@pytest.mark.parametrize("max_pages", [None, 1, 4, 100])
+def test_parallel_pages_equal_serial_pages(pdf_bytes, max_pages):
+    serial = list(iter_pdf_pages(io.BytesIO(pdf_bytes), max_pages=max_pages))
+    assert serial
+    assert list(iter_pdf_pages(io.BytesIO(pdf_bytes), max_pages=max_pages, workers=3)) == serial
+    assert list(iter_pdf_pages(io.BytesIO(pdf_bytes), max_pages=max_pages, workers=2, chunk_size=1)) == serial
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_max_pages_below_one_is_rejected(pdf_bytes, workers):
+    with pytest.raises(ValueError):
+        list(iter_pdf_pages(io.BytesIO(pdf_bytes), max_pages=0, workers=workers))
@@ -0,0 +1,58 @@
+import math
+from collections import Counter
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_job_roles, synthetic_resume
+from modules import role_ranker
+from modules.nlp_analysis import tokenize
+from modules.role_ranker import RoleRanker, get_ranker
+
+def _dense_scores(roles, text):
+    # straightforward dense TF-IDF cosine, as a reference for the postings layout
+    docs = [Counter(tokenize(" ".join([role, *keywords]))) for role, keywords in roles.items()]
+    vocabulary = sorted({term for doc in docs for term in doc})
+    columns = {term: i for i, term in enumerate(vocabulary)}
+    df = np.array([sum(term in doc for doc in docs) for term in vocabulary], dtype=np.float64)
+    idf = np.log((1 + len(docs)) / (1 + df)) + 1
+
+    def vector(counts):
+        v = np.zeros(len(vocabulary))
+        for term, n in counts.items():
+            if term in columns:
+                v[columns[term]] = (1 + math.log(n)) * idf[columns[term]]
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+    matrix = np.array([vector(doc) for doc in docs])
+    return matrix @ vector(Counter(tokenize(text)))
+
+def test_scores_match_dense_tfidf():
+    roles = synthetic_job_roles(80, seed=5)
+    ranker = RoleRanker.build(roles)
+    for seed in range(8):
+        text = synthetic_resume(300, seed=seed)
+        np.testing.assert_allclose(ranker.scores(text), _dense_scores(roles, text), atol=1e-12)
+    assert not ranker.scores("").any()
+
+def test_rank_orders_by_score_then_role_order(tmp_path):
+    roles = {"B role": ["python", "sql"], "A role": ["python", "sql"], "C role": ["java"]}
+    ranker = RoleRanker.build(roles)
+    path = str(tmp_path / "ranker.npz")
+    ranker.save(path)
+    loaded = RoleRanker.load(path)
+    text = synthetic_resume(200, seed=1)
+    assert loaded.rank(text, 3) == ranker.rank(text, 3)
+    assert [role for role, _ in ranker.rank("python sql", 2)] == ["B role", "A role"]
+    assert ranker.rank("python sql", 0) == []
+
+def test_saving_a_new_version_removes_older_matrices(tmp_path, monkeypatch, job_roles):
+    monkeypatch.setattr(role_ranker, "CACHE_DIR", str(tmp_path))
+    other = tmp_path / "notes.txt"
+    other.write_text("kept")
+    for roles in ({"A role": ["python"]}, {"A role": ["python"], "B role": ["java"]}):
+        with job_roles(roles):
+            assert get_ranker().roles == list(roles)
+            saved = sorted(p.name for p in tmp_path.glob("roles-*.npz"))
+            assert saved == [f"roles-{role_ranker.get_registry().version}-v{role_ranker.RANKER_VERSION}.npz"]
+    assert other.exists()
@@ -0,0 +1,13 @@
+from benchmarks.synthetic import SKILLS, synthetic_job_roles, synthetic_resume
+from modules.ats_score import get_all_scores
+from modules.job_registry import get_registry
+from modules.score_matrix import ScoreMatrix
+
+def test_matrix_scores_equal_get_all_scores(job_roles):
+    roles = synthetic_job_roles(60, seed=7)
+    roles["Role dup"] = [SKILLS[2], SKILLS[2], SKILLS[3]]
+    roles["Role empty"] = []
+    texts = [synthetic_resume(250, seed=seed) for seed in range(12)] + [""]
+    with job_roles(roles):
+        matrix = ScoreMatrix(get_registry().index)
+        assert matrix.score_dicts(texts) == [get_all_scores(text) for text in texts]
@@ -0,0 +1,103 @@
+import hashlib
+
+import pytest
+
+from modules import storage_manager
+from modules.ats_score import calculate_ats_score
+from modules.skill_history import rescore_history, resume_skill_bits
+
+ROLES = {
+    "Backend Developer": ["Python", "SQL", "Docker", "Kubernetes", "Go"],
+    "Frontend Developer": ["HTML", "CSS", "React"],
+}
+
+RESUMES = {
+    "ada": "Python developer: SQL, Docker, some Fortran and HTML.",
+    "bob": "Python, SQL and Docker in production; Fortran numerics; React.",
+}
+
+def _hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+@pytest.fixture
+def history_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage_manager, "DB_NAME", str(tmp_path / "analysis_history.db"))
+    storage_manager.init_db()
+    yield storage_manager.get_connection()
+    storage_manager.close_connection()
+
+def _save(username, text, role):
+    storage_manager.save_analysis(username, role, calculate_ats_score(text, role), 3, 4, 120,
+                                  resume_hash=_hash(text), resume_skills=resume_skill_bits(text))
+
+def _scores(conn):
+    return {(user, role): score for user, role, score in conn.execute("SELECT username, role, ats_score FROM history")}
+
+def _assert_rollup_consistent(conn):
+    points = list(conn.execute("SELECT points, ats_score, contributions FROM history"))
+    assert all(p == storage_manager._compute_points(a, c) for p, a, c in points)
+    stats = sorted(conn.execute("SELECT * FROM user_stats"))
+    storage_manager.rebuild_user_stats(conn)
+    assert stats == sorted(conn.execute("SELECT * FROM user_stats"))
+
+def test_rescore_follows_job_description_edits(history_db, job_roles):
+    cached = {_hash(RESUMES["ada"]): RESUMES["ada"]}  # bob's text has been evicted from the cache
+    with job_roles(ROLES):
+        for user, text in RESUMES.items():
+            for role in ROLES:
+                _save(user, text, role)
+        assert rescore_history(lookup_text=cached.get) == (0, 0)
+        assert rescore_history(lookup_text=cached.get) == (0, 0)
+    before = _scores(history_db)
+    assert before[("bob", "Backend Developer")] == 60.0
+
+    # a new skill: ada is re-scanned from her cached text, bob's bitset never saw
+    # "fortran" and his two rows are skipped, keeping their score instead of dropping to 50.0
+    edited = dict(ROLES, **{"Backend Developer": ROLES["Backend Developer"] + ["Fortran"]})
+    with job_roles(edited):
+        assert rescore_history(lookup_text=cached.get) == (1, 2)
+        scores = _scores(history_db)
+        assert scores[("ada", "Backend Developer")] == calculate_ats_score(RESUMES["ada"], "Backend Developer") == 66.67
+        assert scores[("bob", "Backend Developer")] == before[("bob", "Backend Developer")]
+        assert rescore_history(lookup_text=cached.get) == (0, 0)
+
+        carol = "Go and Kubernetes, Python, Fortran, HTML, CSS"
+        _save("carol", carol, "Backend Developer")
+        _save("carol", carol, "Frontend Developer")
+    _assert_rollup_consistent(history_db)
+
+    # no new skills: every complete bitset is re-scored, with or without cached text
+    trimmed = {"Backend Developer": ["Python", "SQL", "Docker", "Fortran"], "Frontend Developer": ["HTML", "CSS"]}
+    with job_roles(trimmed):
+        assert rescore_history(lookup_text={}.get) == (4, 2)
+        scores = _scores(history_db)
+        for user, text in [("ada", RESUMES["ada"]), ("carol", carol)]:
+            for role in trimmed:
+                assert scores[(user, role)] == calculate_ats_score(text, role)
+        assert scores[("bob", "Frontend Developer")] == before[("bob", "Frontend Developer")]
+    _assert_rollup_consistent(history_db)
+
+def test_rescore_leaves_removed_roles_and_unhashed_rows_alone(history_db, job_roles):
+    with job_roles(ROLES):
+        _save("ada", RESUMES["ada"], "Backend Developer")
+        storage_manager.save_analysis("dan", "Backend Developer", 12.0, 1, 1, 5)
+    with job_roles({"Frontend Developer": ["HTML"]}):
+        assert rescore_history(lookup_text={}.get) == (0, 0)
+    assert _scores(history_db) == {("ada", "Backend Developer"): 60.0, ("dan", "Backend Developer"): 12.0}
+
+def test_skipped_rows_are_rescored_once_the_resume_is_analyzed_again(history_db, job_roles):
+    with job_roles(ROLES):
+        _save("bob", RESUMES["bob"], "Backend Developer")
+    edited = dict(ROLES, **{"Backend Developer": ROLES["Backend Developer"] + ["Fortran"]})
+    with job_roles(edited):
+        assert rescore_history(lookup_text={}.get) == (0, 1)
+        assert rescore_history(lookup_text={}.get) == (0, 0)
+        assert _scores(history_db) == {("bob", "Backend Developer"): 60.0}
+
+        # analyzing the same resume again stores a complete bitset, and the next call
+        # re-scores the row skipped earlier without waiting for another job file change
+        storage_manager.save_resume_skills(_hash(RESUMES["bob"]), resume_skill_bits(RESUMES["bob"]))
+        assert rescore_history(lookup_text={}.get) == (1, 0)
+        assert _scores(history_db) == {("bob", "Backend Developer"): calculate_ats_score(RESUMES["bob"], "Backend Developer")}
+        assert rescore_history(lookup_text={}.get) == (0, 0)
+    _assert_rollup_consistent(history_db)
@@ -0,0 +1,62 @@
+import random
+import re
+
+from benchmarks.synthetic import SKILLS, synthetic_job_roles, synthetic_resume
+from modules.ats_score import get_all_scores
+from modules.keyword_analysis import analyze_keywords
+from modules.nlp_analysis import calculate_skill_coverage, calculate_skill_match_percentage
+from modules.skill_matcher import SkillMatcher
+
+def _occurs(keyword, text):
+    # reference rule: word-character edges of the keyword must not touch another word character
+    if not keyword:
+        return True
+    pattern = re.escape(keyword)
+    if re.match(r"\w", keyword[0]):
+        pattern = r"(?<!\w)" + pattern
+    if re.match(r"\w", keyword[-1]):
+        pattern = pattern + r"(?!\w)"
+    return re.search(pattern, text) is not None
+
+def _reference_scores(text, roles):
+    scores = {}
+    for role, keywords in roles.items():
+        if not keywords:
+            scores[role] = 0
+            continue
+        found = sum(1 for kw in keywords if _occurs(kw.lower(), text.lower()))
+        scores[role] = round((found / len(keywords)) * 100, 2)
+    return scores
+
+def test_scan_matches_reference_rule():
+    rng = random.Random(1)
+    alphabet = "ab+.# _c"
+    for _ in range(3000):
+        keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(1, 8))]
+        text = "".join(rng.choice(alphabet + "AB") for _ in range(rng.randint(0, 40)))
+        expected = {kw.lower() for kw in keywords if _occurs(kw.lower(), text.lower())}
+        assert SkillMatcher(keywords).scan(text) == expected, (keywords, text)
+
+def test_keyword_inside_a_longer_word_is_not_a_hit():
+    text = "I write JavaScript and TypeScript every day."
+    assert analyze_keywords(text, ["Java", "JavaScript"]).found == ["JavaScript"]
+    assert calculate_skill_coverage(text, ["Java", "JavaScript"]) == (1, 1, 50)
+    assert calculate_skill_match_percentage(text, ["Java"])[1] == 0
+    # a later standalone occurrence still counts
+    assert SkillMatcher(["java"]).scan("javascript, then java") == {"java"}
+
+def test_punctuated_skills_only_check_their_word_edges():
+    matcher = SkillMatcher(["C++", ".NET", "Node.js", "C#", "Go", "C"])
+    assert matcher.scan("Shipped .net services and node.js tools in C++") == {"c++", ".net", "node.js", "c"}
+    # "go" is part of "golang"; "c++" ends in punctuation, so the "17" after it doesn't matter
+    assert matcher.scan("asp.net core, c++17, golang") == {".net", "c++", "c"}
+    assert matcher.scan("(C#) and go.") == {"c#", "c", "go"}
+
+def test_get_all_scores_matches_reference_scoring(job_roles):
+    roles = synthetic_job_roles(40, seed=3)
+    # a role listing a keyword twice counts it twice
+    roles["Role dup"] = [SKILLS[0], SKILLS[0], SKILLS[1]]
+    with job_roles(roles):
+        for seed in range(10):
+            text = synthetic_resume(300, seed=seed)
+            assert get_all_scores(text) == _reference_scores(text, roles)
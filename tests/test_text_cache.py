@@ -0,0 +1,31 @@
+import os
+
+from modules.text_cache import TextCache
+
+def _size(directory):
+    return sum(os.path.getsize(os.path.join(directory, n)) for n in os.listdir(directory) if n.endswith(".txt"))
+
+def test_running_total_tracks_the_directory(tmp_path):
+    directory = str(tmp_path / "texts")
+    os.makedirs(directory)
+    with open(os.path.join(directory, "old.txt"), "w") as f:
+        f.write("x" * 300)
+
+    cache = TextCache(directory, max_bytes=1000)
+    cache.put("a", "a" * 200)
+    assert cache._total == _size(directory) == 500
+    cache.put("a", "a" * 100)  # overwriting replaces the entry's size rather than adding to it
+    assert cache._total == _size(directory) == 400
+    assert cache.stats["evictions"] == 0
+
+    # past max_bytes, the least recently used entries go first
+    os.utime(os.path.join(directory, "old.txt"), (0, 0))
+    cache.put("b", "b" * 700)
+    assert cache.stats["evictions"] == 1
+    assert cache.get("old") is None
+    assert cache.get("a") == "a" * 100
+    assert cache._total == _size(directory) == 800
+
+    cache.clear()
+    cache.put("c", "c")
+    assert cache._total == _size(directory) == 1